@@ -0,0 +1,77 @@
+"""
+Benchmark CLI startup and per-command import cost
+
+Each measurement runs in a fresh interpreter, so module caches do not carry
+over between samples. Run from the repository root:
+
+    python benchmarks/import_time.py [--runs N]
+"""
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+# Modules imported by each CLI command handler, plus the full pipeline
+COMMAND_IMPORTS = {
+    'search': ['src.cli', 'src.crawler.google_search'],
+    'scrape': ['src.cli', 'src.scraper.scraper'],
+    'clean': ['src.cli', 'src.export.exporter', 'src.utils.data_cleaner'],
+    'export': ['src.cli', 'src.export.exporter', 'src.storage.store'],
+    'main (full)': ['src.main']
+}
+
+# Third-party packages worth tracking
+HEAVY_MODULES = ['bs4', 'requests', 'googlesearch', 'validators', 'loguru', 'dotenv', 'asyncio', 'playwright']
+
+PROBE = """
+import sys, time, json, importlib
+start = time.perf_counter()
+for name in {modules!r}:
+    importlib.import_module(name)
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'loaded': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+def measure_imports(modules, runs):
+    """Time importing modules in fresh interpreters; returns (median seconds, heavy modules loaded)"""
+    samples = []
+    loaded = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', PROBE.format(modules=modules, heavy=HEAVY_MODULES)],
+            check=True, capture_output=True, text=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        samples.append(result['seconds'])
+        loaded = result['loaded']
+    return statistics.median(samples), loaded
+
+def measure_command(args, runs):
+    """Time a full CLI invocation in fresh interpreters; returns median seconds"""
+    import time
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-m', 'src.cli'] + args, check=True, capture_output=True)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10, help="Samples per measurement (default: 10)")
+    args = parser.parse_args()
+
+    print(f"{'command':<14} {'import ms':>10}  third-party modules loaded")
+    for command, modules in COMMAND_IMPORTS.items():
+        seconds, loaded = measure_imports(modules, args.runs)
+        print(f"{command:<14} {seconds * 1000:>10.1f}  {', '.join(loaded) or '-'}")
+
+    print()
+    print(f"{'invocation':<28} {'wall ms':>10}")
+    for invocation in (['--help'], ['scrape', '--help']):
+        seconds = measure_command(invocation, args.runs)
+        print(f"{'src.cli ' + ' '.join(invocation):<28} {seconds * 1000:>10.1f}")
+
+if __name__ == "__main__":
+    main()
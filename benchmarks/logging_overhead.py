@@ -0,0 +1,78 @@
+"""
+Benchmark logging overhead per scraped page under concurrency
+
+Simulates the per-URL log lines of a page (search, validation, contact page,
+scrape) from several threads and reports the time spent in logging calls
+per page for each logging mode. Run from the repository root:
+
+    python -m benchmarks.logging_overhead [--pages N] [--threads N]
+"""
+import os
+import time
+import argparse
+import tempfile
+import threading
+from loguru import logger
+from src.utils.log_config import configure_logging
+
+# (name, configure_logging options)
+MODES = [
+    ('sync text (default)', {}),
+    ('sync json', {'json': True}),
+    ('background text', {'background': True}),
+    ('background json', {'background': True, 'json': True}),
+    ('background + rate limit', {'background': True, 'rate': 50}),
+    ('background, crawl=WARNING', {'background': True, 'stage_levels': {'crawl': 'WARNING'}}),
+]
+
+def stage_logger(module: str):
+    """Logger whose records appear to come from a pipeline module"""
+    return logger.patch(lambda record: record.update(name=module))
+
+search_logger = stage_logger('src.crawler.google_search')
+crawl_logger = stage_logger('src.crawler.crawler')
+scrape_logger = stage_logger('src.scraper.scraper')
+
+def log_page(url: str):
+    """Emit the log lines a typical page produces"""
+    search_logger.info(f"Found new website: {url}")
+    search_logger.info(f"Validated travel website: {url}")
+    crawl_logger.info(f"Found contact page at {url}/kontak")
+    crawl_logger.info(f"Retrying {url}/about (attempt 1/3)")
+    scrape_logger.info(f"No static contacts found, rendering {url}")
+
+def run(pages: int, threads: int) -> float:
+    """Log `pages` pages from `threads` threads; returns seconds per page"""
+    per_thread = pages // threads
+
+    def worker(offset: int):
+        for i in range(per_thread):
+            log_page(f"https://agency{offset + i}.co.id")
+
+    workers = [threading.Thread(target=worker, args=(n * per_thread,)) for n in range(threads)]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+    return elapsed / (per_thread * threads)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pages', type=int, default=4000, help="Pages to simulate per mode (default: 4000)")
+    parser.add_argument('--threads', type=int, default=8, help="Logging threads (default: 8)")
+    args = parser.parse_args()
+
+    print(f"{'mode':<26} {'us/page':>10} {'suppressed':>11}")
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, 'w') as devnull:
+        for name, options in MODES:
+            filters = configure_logging(console=devnull, log_file=os.path.join(tmp, 'bench.log'), **options)
+            seconds = run(args.pages, args.threads)
+            # Removing the sinks writes out anything still queued
+            logger.remove()
+            suppressed = sum(f.suppressed for f in filters)
+            print(f"{name:<26} {seconds * 1e6:>10.1f} {suppressed:>11}")
+
+if __name__ == "__main__":
+    main()
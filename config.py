@@ -1,8 +1,4 @@
 import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
 
 # Search Configuration
 SEARCH_KEYWORDS = [
@@ -19,10 +15,93 @@ USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTM
 REQUEST_TIMEOUT = 30  # seconds
 MAX_RETRIES = 3
 DELAY_BETWEEN_REQUESTS = 2  # seconds
+SCRAPE_CONCURRENCY = 8  # websites scraped in parallel by scrape_many
+
+# Adaptive Throttling Configuration
+THROTTLE_INITIAL_DELAY = DELAY_BETWEEN_REQUESTS  # seconds between requests to a host it has not seen yet
+THROTTLE_MIN_DELAY = 0.5  # seconds
+THROTTLE_MAX_DELAY = 60  # seconds
+THROTTLE_DELAY_STEP = 0.25  # additive delay change per response
+THROTTLE_BACKOFF_FACTOR = 2  # multiplicative delay increase on 429/5xx/errors
+THROTTLE_TARGET_LATENCY = 3.0  # seconds; slower responses mean the host is under load
+HOST_MAX_CONCURRENCY = 4  # concurrent requests per host ceiling
+GLOBAL_MAX_CONCURRENCY = 32  # concurrent requests across all hosts ceiling
+
+# Website Validation Configuration
+VALIDATION_PARTIAL_BYTES = 32 * 1024  # bytes scanned before falling back to a full fetch
+DOMAIN_ALLOWLIST = []  # domains always accepted as travel agencies
+DOMAIN_BLOCKLIST = [
+    # News portals
+    "detik.com",
+    "kompas.com",
+    "tribunnews.com",
+    "liputan6.com",
+    "cnnindonesia.com",
+    "kumparan.com",
+    "okezone.com",
+    "republika.co.id",
+    "tempo.co",
+    # Marketplaces and online travel agents
+    "tokopedia.com",
+    "shopee.co.id",
+    "bukalapak.com",
+    "lazada.co.id",
+    "blibli.com",
+    "traveloka.com",
+    "tiket.com",
+    # Social media and reference sites
+    "facebook.com",
+    "instagram.com",
+    "youtube.com",
+    "tiktok.com",
+    "twitter.com",
+    "x.com",
+    "linkedin.com",
+    "wikipedia.org",
+    "google.com"
+]
+# Matched against full search result URLs, before they are reduced to base URLs
+URL_BLOCKLIST_PATTERNS = [
+    r'^https?://(?:news|berita|blog|forum)\.',
+    r'/(?:news|berita|artikel|blog|forum)/'
+]
+
+# Rendering Configuration (optional, requires playwright)
+RENDER_MAX_CONTEXTS = 2  # concurrent headless browser contexts
+RENDER_TIMEOUT = 20  # seconds per page
+RENDER_SETTLE_TIME = 2  # max seconds to wait for scripts after the load event
+RENDER_BLOCKED_RESOURCES = ['image', 'font', 'media']
+
+# Logging Configuration
+LOG_LEVEL = 'INFO'
+LOG_FILE = 'scraper.log'
+LOG_ROTATION = 500 * 1024 * 1024  # bytes
+LOG_JSON = False  # structured JSON lines instead of text
+LOG_BACKGROUND = False  # write logs from a background thread
+LOG_STAGE_LEVELS = {}  # per-stage levels, e.g. {'crawl': 'WARNING', 'search': 'DEBUG'}
+LOG_RATE_LIMIT = 0  # routine messages per second per call site, 0 disables rate limiting
+LOG_RATE_BURST = 20  # routine messages allowed per call site before rate limiting starts
 
 # Export Configuration
 EXPORT_DIRECTORY = 'exports'
 CSV_FILENAME = 'haji_umroh_organizers.csv'
 
-# Create export directory if it doesn't exist
-os.makedirs(EXPORT_DIRECTORY, exist_ok=True)
+# Storage Configuration
+DATABASE_PATH = os.path.join(EXPORT_DIRECTORY, 'organizers.db')
+
+# Distributed Queue Configuration
+QUEUE_PATH = os.path.join(EXPORT_DIRECTORY, 'queue.db')
+QUEUE_LEASE_SECONDS = 300  # time a worker may hold a task before it is re-leased
+QUEUE_MAX_ATTEMPTS = MAX_RETRIES + 1
+QUEUE_POLL_INTERVAL = 5  # seconds between lease attempts when no task is ready
+HOST_POLITENESS_DELAY = DELAY_BETWEEN_REQUESTS  # seconds between tasks on the same host, across all workers
+
+def load_environment():
+    """
+    Load environment variables from a .env file
+
+    Called by the entry points rather than at import time, so importing
+    config stays free of side effects.
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
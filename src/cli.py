@@ -0,0 +1,187 @@
+"""
+Command line interface for the Haji & Umroh scraper
+
+Each subcommand imports only the modules it needs, inside its handler, so
+short runs such as single-URL scrapes, re-exports and health checks do not
+pay for loading the whole scraping stack.
+"""
+import sys
+import argparse
+from .config import (
+    DATABASE_PATH, REQUEST_TIMEOUT, SCRAPE_CONCURRENCY, LOG_LEVEL, LOG_JSON,
+    LOG_BACKGROUND, LOG_RATE_LIMIT, LOG_STAGE_LEVELS, load_environment
+)
+
+def log_level(value: str) -> str:
+    """Argument type for loguru level names, e.g. debug or WARNING"""
+    from loguru import logger
+    
+    level = value.upper()
+    try:
+        logger.level(level)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"unknown log level {value!r}")
+    return level
+
+def stage_level(value: str):
+    """Argument type for STAGE=LEVEL pairs"""
+    stage, sep, level = value.partition('=')
+    if not sep or not stage:
+        raise argparse.ArgumentTypeError(f"expected STAGE=LEVEL, got {value!r}")
+    return stage, log_level(level)
+
+def write_lines(lines, output: str = None):
+    """Write lines to a file, or to stdout if no file is given"""
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.writelines(f"{line}\n" for line in lines)
+    else:
+        for line in lines:
+            print(line)
+
+def cmd_search(args) -> int:
+    """Search Google for travel agency websites and print their URLs"""
+    from .crawler.google_search import GoogleSearchCrawler
+
+    google_crawler = GoogleSearchCrawler()
+    try:
+        websites = google_crawler.search_travel_agencies(args.results)
+        if not args.no_validate:
+            websites = google_crawler.filter_valid_websites(websites)
+    finally:
+        google_crawler.crawler.close()
+
+    write_lines(websites, args.output)
+    return 0
+
+def read_urls(args):
+    """Yield URLs from the command line, a file, or stdin ('-' or no URLs given)"""
+    if args.urls and args.urls != ['-']:
+        yield from args.urls
+        return
+
+    source = open(args.file, encoding='utf-8') if args.file else sys.stdin
+    try:
+        for line in source:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                yield line
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+def cmd_scrape(args) -> int:
+    """Scrape websites concurrently and stream results as JSON lines"""
+    import json
+    from loguru import logger
+    from .crawler.crawler import Crawler
+    from .scraper.batch import scrape_many
+
+    counts = {'ok': 0, 'no_data': 0, 'error': 0}
+    for result in scrape_many(read_urls(args), concurrency=args.concurrency, timeout=args.timeout):
+        counts[result.status] += 1
+        print(json.dumps(result.to_dict(), ensure_ascii=False), flush=True)
+
+    logger.info(f"Scraped {sum(counts.values())} URLs: {counts['ok']} ok, "
+                f"{counts['no_data']} without data, {counts['error']} errors")
+    for host, state in Crawler.shared_throttle().snapshot().items():
+        logger.debug(f"Throttle {host}: delay {state['delay']:.2f}s, concurrency {state['concurrency']}, "
+                     f"error rate {state['error_rate']:.2f} over {state['requests']} requests")
+    return 0 if counts['ok'] or not sum(counts.values()) else 1
+
+def cmd_clean(args) -> int:
+    """Clean and deduplicate an exported CSV file"""
+    from .export.exporter import Exporter
+    from .utils.data_cleaner import DataCleaner
+
+    organizers = Exporter.load_from_csv(args.input)
+    cleaned_organizers = DataCleaner.clean_dataset(organizers)
+    print(Exporter.to_csv(cleaned_organizers, args.output))
+    return 0
+
+def cmd_export(args) -> int:
+    """Export organizers from the persistent store to CSV"""
+    from .export.exporter import Exporter
+    from .storage.store import OrganizerStore
+
+    store = OrganizerStore(args.db or DATABASE_PATH)
+    try:
+        if args.since is None:
+            organizers = store.all_organizers()
+        else:
+            organizers = store.new_since(args.since) + store.changed_since(args.since)
+    finally:
+        store.close()
+
+    print(Exporter.to_csv(organizers, args.output))
+    return 0
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for all subcommands"""
+    parser = argparse.ArgumentParser(prog='python -m src.cli', description="Haji & Umroh organizer scraper")
+    parser.add_argument('--log-level', type=log_level, default=LOG_LEVEL, help=f"Minimum log level (default: {LOG_LEVEL})")
+    parser.add_argument('--log-json', action='store_true', default=LOG_JSON, help="Log structured JSON lines")
+    parser.add_argument('--log-async', action='store_true', default=LOG_BACKGROUND, help="Write logs from a background thread")
+    parser.add_argument('--log-rate', type=float, default=LOG_RATE_LIMIT,
+                        help="Routine messages per second per call site (0: unlimited)")
+    parser.add_argument('--log-stage', type=stage_level, action='append', default=[], metavar='STAGE=LEVEL',
+                        help="Level for one stage, e.g. crawl=WARNING (repeatable)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    search_parser = subparsers.add_parser('search', help="Find travel agency websites")
+    search_parser.add_argument('--results', type=int, default=10, help="Search results per keyword")
+    search_parser.add_argument('--no-validate', action='store_true', help="Skip travel website validation")
+    search_parser.add_argument('--output', help="File to write URLs to (default: stdout)")
+    search_parser.set_defaults(handler=cmd_search)
+
+    scrape_parser = subparsers.add_parser('scrape', help="Scrape contact information from websites")
+    url_source = scrape_parser.add_mutually_exclusive_group()
+    url_source.add_argument('urls', nargs='*', default=[], metavar='url', help="Website URLs to scrape ('-' or none: read stdin)")
+    url_source.add_argument('--file', help="File with one URL per line")
+    scrape_parser.add_argument('--concurrency', type=int, default=SCRAPE_CONCURRENCY, help="Websites scraped at once")
+    scrape_parser.add_argument('--timeout', type=float, default=REQUEST_TIMEOUT, help="Per-request timeout in seconds")
+    scrape_parser.set_defaults(handler=cmd_scrape)
+
+    clean_parser = subparsers.add_parser('clean', help="Clean and deduplicate an exported CSV file")
+    clean_parser.add_argument('input', help="CSV file to clean")
+    clean_parser.add_argument('--output', help="Output filename in the export directory")
+    clean_parser.set_defaults(handler=cmd_clean)
+
+    export_parser = subparsers.add_parser('export', help="Export the persistent store to CSV")
+    export_parser.add_argument('--db', help="Store database path (default: DATABASE_PATH)")
+    export_parser.add_argument('--since', type=int, help="Only organizers new or changed after this run ID")
+    export_parser.add_argument('--output', help="Output filename in the export directory")
+    export_parser.set_defaults(handler=cmd_export)
+
+    return parser
+
+def main(argv=None) -> int:
+    """Entry point for the command line interface"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    load_environment()
+
+    stage_levels = dict(LOG_STAGE_LEVELS)
+    stage_levels.update(args.log_stage)
+
+    # Logs go to stderr so that stdout stays machine-readable
+    from .utils.log_config import configure_logging
+    configure_logging(
+        level=args.log_level,
+        json=args.log_json,
+        background=args.log_async,
+        stage_levels=stage_levels,
+        rate=args.log_rate,
+        console=sys.stderr,
+        log_file=None
+    )
+
+    try:
+        return args.handler(args)
+    except Exception as e:
+        from loguru import logger
+        logger.error(f"Fatal error: {str(e)}")
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
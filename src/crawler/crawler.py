@@ -1,14 +1,27 @@
-import time
+import threading
 import requests
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
+from urllib.parse import urlparse
 from loguru import logger
 from requests.exceptions import RequestException
-from ..config import USER_AGENT, REQUEST_TIMEOUT, MAX_RETRIES, DELAY_BETWEEN_REQUESTS
+from .throttle import AdaptiveThrottle
+from ..config import USER_AGENT, REQUEST_TIMEOUT, MAX_RETRIES
 
 class Crawler:
     """Base crawler class for fetching web pages"""
     
-    def __init__(self):
+    # Throttle shared by all crawlers unless one is passed explicitly
+    _shared_throttle: Optional[AdaptiveThrottle] = None
+    _shared_throttle_lock = threading.Lock()
+    
+    def __init__(self, timeout: Optional[float] = None, throttle: Optional[AdaptiveThrottle] = None):
+        """
+        Args:
+            timeout (float, optional): Per-request timeout in seconds, defaults to REQUEST_TIMEOUT
+            throttle (AdaptiveThrottle, optional): Per-host scheduler, defaults to one shared by all crawlers
+        """
+        self.timeout = timeout or REQUEST_TIMEOUT
+        self.throttle = throttle or Crawler.shared_throttle()
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': USER_AGENT,
@@ -16,6 +29,61 @@ class Crawler:
             'Accept-Language': 'en-US,en;q=0.5',
         })
 
+    @classmethod
+    def shared_throttle(cls) -> AdaptiveThrottle:
+        """
+        Get the throttle shared by all crawlers in this process
+        
+        Returns:
+            AdaptiveThrottle: Shared throttle, created on first use
+        """
+        if cls._shared_throttle is None:
+            # Worker threads create their crawlers at the same time
+            with cls._shared_throttle_lock:
+                if cls._shared_throttle is None:
+                    cls._shared_throttle = AdaptiveThrottle()
+        return cls._shared_throttle
+
+    def throttle_state(self) -> Dict[str, dict]:
+        """
+        Get the current per-host throttling decisions, for monitoring
+        
+        Returns:
+            Dict[str, dict]: Delay, concurrency, latency and error rate per host
+        """
+        return self.throttle.snapshot()
+
+    def _request(self, url: str, **kwargs) -> requests.Response:
+        """
+        Send a GET request once the throttle allows it, reporting the outcome back
+        
+        Args:
+            url (str): URL to fetch
+            **kwargs: Extra arguments for requests.Session.get
+        
+        Returns:
+            requests.Response: Response received (not checked for errors)
+        """
+        host = urlparse(url).netloc.lower()
+        started = self.throttle.acquire(host)
+        response = None
+        
+        try:
+            response = self.session.get(url, timeout=self.timeout, **kwargs)
+            return response
+        finally:
+            # Always give the slot back, failures without a response count as congestion
+            if response is None:
+                self.throttle.release(host, started)
+            else:
+                retry_after = response.headers.get('Retry-After', '')
+                self.throttle.release(
+                    host,
+                    started,
+                    status_code=response.status_code,
+                    retry_after=float(retry_after) if retry_after.isdigit() else None
+                )
+
     def get_page(self, url: str, retry_count: int = 0) -> Optional[str]:
         """
         Fetch a web page with retry mechanism
@@ -28,10 +96,8 @@ class Crawler:
             Optional[str]: HTML content of the page if successful, None otherwise
         """
         try:
-            # Add delay between requests to be polite
-            time.sleep(DELAY_BETWEEN_REQUESTS)
-            
-            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+            # Per-host delays are applied by the throttle
+            response = self._request(url)
             response.raise_for_status()
             
             return response.text
@@ -41,12 +107,52 @@ class Crawler:
             
             if retry_count < MAX_RETRIES:
                 logger.info(f"Retrying {url} (attempt {retry_count + 1}/{MAX_RETRIES})")
-                # Exponential backoff
-                time.sleep(DELAY_BETWEEN_REQUESTS * (2 ** retry_count))
+                # Backoff comes from the throttle, which slows the host down on errors
                 return self.get_page(url, retry_count + 1)
             
             return None
 
+    def get_partial_page(self, url: str, max_bytes: int, retry_count: int = 0) -> Tuple[Optional[str], bool]:
+        """
+        Fetch only the first bytes of a web page with retry mechanism
+        
+        Args:
+            url (str): URL to fetch
+            max_bytes (int): Maximum number of bytes to download
+            retry_count (int): Current retry attempt number
+        
+        Returns:
+            Tuple[Optional[str], bool]: HTML content downloaded (None if the request
+                failed) and whether it is the complete page
+        """
+        try:
+            # Per-host delays are applied by the throttle
+            with self._request(url, stream=True) as response:
+                response.raise_for_status()
+                
+                chunks = []
+                size = 0
+                complete = True
+                for chunk in response.iter_content(chunk_size=8192):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= max_bytes:
+                        complete = False
+                        break
+                
+                content = b''.join(chunks)[:max_bytes]
+                return content.decode(response.encoding or 'utf-8', errors='replace'), complete
+
+        except RequestException as e:
+            logger.error(f"Error fetching {url}: {str(e)}")
+            
+            if retry_count < MAX_RETRIES:
+                logger.info(f"Retrying {url} (attempt {retry_count + 1}/{MAX_RETRIES})")
+                # Backoff comes from the throttle, which slows the host down on errors
+                return self.get_partial_page(url, max_bytes, retry_count + 1)
+            
+            return None, True
+
     def get_contact_page(self, base_url: str) -> Optional[str]:
         """
         Try to find and fetch the contact page of a website
@@ -1,10 +1,37 @@
-from typing import List, Set
+import re
+from typing import Dict, List, Optional, Set
+from urllib.parse import urlparse
 from loguru import logger
 from googlesearch import search
 from .crawler import Crawler
-from ..config import SEARCH_KEYWORDS, DELAY_BETWEEN_REQUESTS
+from ..config import (
+    SEARCH_KEYWORDS, DELAY_BETWEEN_REQUESTS, VALIDATION_PARTIAL_BYTES,
+    DOMAIN_ALLOWLIST, DOMAIN_BLOCKLIST, URL_BLOCKLIST_PATTERNS
+)
 import time
 
+# Keywords that suggest this is a travel agency website
+TRAVEL_KEYWORDS = [
+    'umroh',
+    'umrah',
+    'haji',
+    'hajj',
+    'travel',
+    'wisata',
+    'ziarah',
+    'mekkah',
+    'madinah',
+    'saudi',
+    'paket'
+]
+
+# Minimum number of distinct keywords for a page to count as a travel agency
+MIN_KEYWORD_MATCHES = 3
+
+# Single pass over the content instead of one scan per keyword
+TRAVEL_KEYWORD_PATTERN = re.compile('|'.join(map(re.escape, TRAVEL_KEYWORDS)), re.IGNORECASE)
+URL_BLOCKLIST_PATTERN = re.compile('|'.join(URL_BLOCKLIST_PATTERNS), re.IGNORECASE)
+
 class GoogleSearchCrawler:
     """
     Class for searching Google to find travel agency websites
@@ -13,6 +40,8 @@ class GoogleSearchCrawler:
     def __init__(self):
         self.crawler = Crawler()
         self.found_urls: Set[str] = set()
+        # Search result titles and descriptions, keyed by base URL
+        self.snippets: Dict[str, str] = {}
 
     def search_travel_agencies(self, num_results: int = 10) -> List[str]:
         """
@@ -34,14 +63,21 @@ class GoogleSearchCrawler:
                 try:
                     # Use googlesearch-python to get results
                     search_results = search(
-                        query=search_query,
+                        term=search_query,
                         num_results=num_results,
-                        lang="id"  # Indonesian results
+                        lang="id",  # Indonesian results
+                        advanced=True  # Include title and description
                     )
                     
                     # Process each result
-                    for url in search_results:
+                    for result in search_results:
+                        url = result.url
                         try:
+                            # Path patterns such as /berita/ only exist on the full result URL
+                            if self.classify_by_url(url) is False:
+                                logger.debug(f"Skipping blocklisted result: {url}")
+                                continue
+                            
                             # Extract base URL to avoid duplicate subpages
                             base_url = self.crawler.extract_base_url(url)
                             
@@ -49,6 +85,10 @@ class GoogleSearchCrawler:
                             if base_url not in self.found_urls:
                                 logger.info(f"Found new website: {base_url}")
                                 self.found_urls.add(base_url)
+                            
+                            # Keep snippets for cheap validation later
+                            snippet = f"{result.title} {result.description}"
+                            self.snippets[base_url] = f"{self.snippets.get(base_url, '')} {snippet}".strip()
                                 
                             # Add delay between searches
                             time.sleep(DELAY_BETWEEN_REQUESTS)
@@ -73,10 +113,59 @@ class GoogleSearchCrawler:
         finally:
             self.crawler.close()
 
+    @staticmethod
+    def count_travel_keywords(text: str, limit: int = len(TRAVEL_KEYWORDS)) -> int:
+        """
+        Count distinct travel keywords in text using a single scan
+        
+        Args:
+            text (str): Text to scan
+            limit (int): Stop scanning once this many keywords were found
+            
+        Returns:
+            int: Number of distinct keywords found (at most limit)
+        """
+        found = set()
+        for match in TRAVEL_KEYWORD_PATTERN.finditer(text):
+            found.add(match.group().lower())
+            if len(found) >= limit:
+                break
+        return len(found)
+
+    @staticmethod
+    def classify_by_url(url: str) -> Optional[bool]:
+        """
+        Classify a website from its domain and URL alone
+        
+        Search results are checked with their full URL, so that path
+        patterns apply, and again with the base URL during validation.
+        
+        Args:
+            url (str): Website URL to classify
+            
+        Returns:
+            Optional[bool]: True if allowlisted, False if blocklisted, None if undecided
+        """
+        domain = urlparse(url).netloc.lower()
+        
+        def matches(domains: List[str]) -> bool:
+            return any(domain == d or domain.endswith(f".{d}") for d in domains)
+        
+        if matches(DOMAIN_ALLOWLIST):
+            return True
+        if matches(DOMAIN_BLOCKLIST) or URL_BLOCKLIST_PATTERN.search(url):
+            return False
+        return None
+
     def validate_travel_website(self, url: str) -> bool:
         """
         Basic validation to check if a website is likely a travel agency
         
+        Uses a tiered check, stopping at the first conclusive tier:
+        domain/URL lists, search snippet, the first VALIDATION_PARTIAL_BYTES
+        of the homepage, and only when that finds some but not enough
+        keywords, the full homepage.
+        
         Args:
             url (str): Website URL to validate
             
@@ -84,33 +173,37 @@ class GoogleSearchCrawler:
             bool: True if website appears to be a travel agency
         """
         try:
-            # Get homepage content
-            content = self.crawler.get_page(url)
+            # Tier 1: domain allowlist/blocklist and URL patterns
+            verdict = self.classify_by_url(url)
+            if verdict is not None:
+                logger.debug(f"Classified {url} by URL: {verdict}")
+                return verdict
+            
+            # Tier 2: search result title and description
+            snippet = self.snippets.get(url, '')
+            if self.count_travel_keywords(snippet, MIN_KEYWORD_MATCHES) >= MIN_KEYWORD_MATCHES:
+                logger.debug(f"Classified {url} by search snippet")
+                return True
+            
+            # Tier 3: first part of the homepage
+            content, complete = self.crawler.get_partial_page(url, VALIDATION_PARTIAL_BYTES)
             if not content:
                 return False
             
-            # Convert to lowercase for case-insensitive matching
-            content_lower = content.lower()
-            
-            # Keywords that suggest this is a travel agency website
-            travel_keywords = [
-                'umroh',
-                'umrah',
-                'haji',
-                'hajj',
-                'travel',
-                'wisata',
-                'ziarah',
-                'mekkah',
-                'madinah',
-                'saudi',
-                'paket'
-            ]
+            matches = self.count_travel_keywords(content, MIN_KEYWORD_MATCHES)
+            if matches >= MIN_KEYWORD_MATCHES:
+                return True
+            if matches == 0 or complete:
+                # No travel keyword near the top of the page, not worth a second download
+                return False
             
-            # Check if at least 3 keywords are present
-            keyword_count = sum(1 for keyword in travel_keywords if keyword in content_lower)
+            # Tier 4: full homepage when only some keywords were found
+            logger.debug(f"Fetching full homepage of {url} for validation")
+            content = self.crawler.get_page(url)
+            if not content:
+                return False
             
-            return keyword_count >= 3
+            return self.count_travel_keywords(content, MIN_KEYWORD_MATCHES) >= MIN_KEYWORD_MATCHES
             
         except Exception as e:
             logger.error(f"Error validating website {url}: {str(e)}")
@@ -120,6 +213,9 @@ class GoogleSearchCrawler:
         """
         Filter list of URLs to only include valid travel agency websites
         
+        Requests are paced per host by the crawler's throttle, so websites
+        decided without any request cost no delay.
+        
         Args:
             urls (List[str]): List of URLs to filter
             
@@ -135,9 +231,6 @@ class GoogleSearchCrawler:
                     valid_urls.append(url)
                 else:
                     logger.info(f"Skipping non-travel website: {url}")
-                    
-                # Add delay between validations
-                time.sleep(DELAY_BETWEEN_REQUESTS)
                 
             except Exception as e:
                 logger.error(f"Error filtering website {url}: {str(e)}")
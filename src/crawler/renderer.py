@@ -0,0 +1,142 @@
+import asyncio
+import threading
+from typing import List, Optional
+from loguru import logger
+from ..config import (
+    USER_AGENT, RENDER_MAX_CONTEXTS, RENDER_TIMEOUT, RENDER_SETTLE_TIME, RENDER_BLOCKED_RESOURCES
+)
+
+class Renderer:
+    """
+    Bounded pool of reusable headless browser contexts for JavaScript-only pages
+
+    The browser runs on a dedicated event loop thread, so render() can be
+    called from any thread. At most max_contexts pages render at once;
+    further callers wait for a free context. Pages are read after the load
+    event plus at most settle_time for the network to go quiet. Requires
+    the optional playwright package and its chromium build.
+    """
+
+    def __init__(
+        self,
+        max_contexts: int = RENDER_MAX_CONTEXTS,
+        timeout: float = RENDER_TIMEOUT,
+        blocked_resources: List[str] = None,
+        settle_time: float = RENDER_SETTLE_TIME
+    ):
+        try:
+            from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+        except ImportError as e:
+            raise ImportError(
+                "JavaScript rendering requires playwright: "
+                "pip install playwright && playwright install chromium"
+            ) from e
+
+        self.max_contexts = max_contexts
+        self.timeout = timeout
+        self.settle_time = settle_time
+        self._timeout_error = PlaywrightTimeoutError
+        self.blocked_resources = set(
+            RENDER_BLOCKED_RESOURCES if blocked_resources is None else blocked_resources
+        )
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='renderer', daemon=True)
+        self._thread.start()
+
+        try:
+            self._run(self._start(async_playwright))
+        except Exception:
+            self.close()
+            raise
+
+    def _run(self, coroutine, timeout: Optional[float] = None):
+        """Run a coroutine on the renderer loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result(timeout)
+
+    async def _start(self, async_playwright):
+        """Launch the browser and fill the context pool"""
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=True)
+        self._contexts: asyncio.Queue = asyncio.Queue()
+
+        for _ in range(self.max_contexts):
+            context = await self._browser.new_context(user_agent=USER_AGENT)
+            context.set_default_timeout(self.timeout * 1000)
+            if self.blocked_resources:
+                await context.route('**/*', self._route)
+            self._contexts.put_nowait(context)
+
+        logger.info(f"Started headless renderer with {self.max_contexts} contexts")
+
+    async def _route(self, route):
+        """Abort requests for blocked resource types"""
+        if route.request.resource_type in self.blocked_resources:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _render(self, url: str) -> Optional[str]:
+        """Render a page in a pooled context"""
+        context = await self._contexts.get()
+        page = None
+        try:
+            page = await context.new_page()
+            try:
+                await page.goto(url, wait_until='load', timeout=self.timeout * 1000)
+            except self._timeout_error:
+                # Slow subresources, the DOM may still hold the contacts
+                if page.url == 'about:blank':
+                    raise
+                logger.warning(f"Timed out loading {url}, using the page rendered so far")
+            
+            # Give scripts a moment to inject content, analytics and chat
+            # widgets keep polling so the network may never go idle
+            try:
+                await page.wait_for_load_state('networkidle', timeout=self.settle_time * 1000)
+            except self._timeout_error:
+                pass
+            return await page.content()
+        finally:
+            if page:
+                await page.close()
+            self._contexts.put_nowait(context)
+
+    def render(self, url: str) -> Optional[str]:
+        """
+        Render a web page with a headless browser
+
+        Args:
+            url (str): URL to render (http(s):// or file:// for local fixtures)
+
+        Returns:
+            Optional[str]: Rendered HTML if successful, None otherwise
+        """
+        try:
+            return self._run(self._render(url))
+        except Exception as e:
+            logger.error(f"Error rendering {url}: {str(e)}")
+            return None
+
+    async def _stop(self):
+        """Close all contexts, the browser and playwright"""
+        if hasattr(self, '_contexts'):
+            while not self._contexts.empty():
+                await self._contexts.get_nowait().close()
+        if hasattr(self, '_browser'):
+            await self._browser.close()
+        if hasattr(self, '_playwright'):
+            await self._playwright.stop()
+
+    def close(self):
+        """Shut down the browser and the renderer thread"""
+        if not self._loop.is_running():
+            return
+        try:
+            self._run(self._stop(), timeout=self.timeout)
+        except Exception as e:
+            logger.error(f"Error closing renderer: {str(e)}")
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
@@ -0,0 +1,156 @@
+import time
+import threading
+from dataclasses import dataclass, asdict
+from typing import Dict, Optional
+from loguru import logger
+from ..config import (
+    THROTTLE_INITIAL_DELAY, THROTTLE_MIN_DELAY, THROTTLE_MAX_DELAY, THROTTLE_DELAY_STEP,
+    THROTTLE_BACKOFF_FACTOR, THROTTLE_TARGET_LATENCY, HOST_MAX_CONCURRENCY, GLOBAL_MAX_CONCURRENCY
+)
+
+# Too Many Requests; 5xx responses are treated the same way
+TOO_MANY_REQUESTS = 429
+
+# Weight of the latest response in the moving averages
+EWMA_ALPHA = 0.3
+
+@dataclass
+class HostState:
+    """
+    Current throttling decisions and observations for one host
+    """
+    delay: float = THROTTLE_INITIAL_DELAY
+    concurrency_limit: float = 1.0
+    active: int = 0
+    next_allowed: float = 0.0
+    latency: Optional[float] = None  # moving average, seconds
+    error_rate: float = 0.0  # moving average of 429/5xx/failed responses
+    requests: int = 0
+    last_status: Optional[int] = None
+
+class AdaptiveThrottle:
+    """
+    Per-host request scheduler tuned from observed responses (AIMD)
+
+    Each host starts at one request at a time, THROTTLE_INITIAL_DELAY apart.
+    Fast successful responses additively raise its concurrency (up to
+    HOST_MAX_CONCURRENCY) and shorten its delay by THROTTLE_DELAY_STEP.
+    Slow responses lengthen the delay by the same step. A 429, a 5xx or a
+    failed request halves the concurrency and multiplies the delay by
+    THROTTLE_BACKOFF_FACTOR, honoring Retry-After. At most
+    GLOBAL_MAX_CONCURRENCY requests run across all hosts.
+    """
+
+    def __init__(
+        self,
+        host_max_concurrency: int = HOST_MAX_CONCURRENCY,
+        global_max_concurrency: int = GLOBAL_MAX_CONCURRENCY,
+        initial_delay: float = THROTTLE_INITIAL_DELAY,
+        min_delay: float = THROTTLE_MIN_DELAY,
+        max_delay: float = THROTTLE_MAX_DELAY
+    ):
+        self.host_max_concurrency = host_max_concurrency
+        self.global_max_concurrency = global_max_concurrency
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+
+        self._hosts: Dict[str, HostState] = {}
+        self._active = 0
+        self._condition = threading.Condition()
+
+    def _state(self, host: str) -> HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = HostState(delay=self.initial_delay)
+        return state
+
+    def acquire(self, host: str) -> float:
+        """
+        Wait until a request to host is allowed and reserve a slot for it
+
+        Args:
+            host (str): Host about to be requested
+
+        Returns:
+            float: Monotonic start time, to be passed back to release()
+        """
+        with self._condition:
+            while True:
+                state = self._state(host)
+                now = time.monotonic()
+                has_slot = (self._active < self.global_max_concurrency
+                            and state.active < int(state.concurrency_limit))
+
+                if has_slot and now >= state.next_allowed:
+                    state.active += 1
+                    self._active += 1
+                    state.next_allowed = now + state.delay
+                    return now
+
+                # Sleep until the host's delay passes, or until a slot is released
+                self._condition.wait(state.next_allowed - now if has_slot else None)
+
+    def release(
+        self,
+        host: str,
+        started: float,
+        status_code: Optional[int] = None,
+        retry_after: Optional[float] = None
+    ):
+        """
+        Free a request slot and adapt the host's delay and concurrency
+
+        Args:
+            host (str): Host that was requested
+            started (float): Value returned by acquire()
+            status_code (int, optional): HTTP status, None if the request failed
+            retry_after (float, optional): Retry-After header value in seconds
+        """
+        latency = time.monotonic() - started
+
+        with self._condition:
+            state = self._state(host)
+            state.active -= 1
+            self._active -= 1
+            state.requests += 1
+            state.last_status = status_code
+            state.latency = latency if state.latency is None else (
+                EWMA_ALPHA * latency + (1 - EWMA_ALPHA) * state.latency
+            )
+
+            congested = status_code is None or status_code == TOO_MANY_REQUESTS or status_code >= 500
+            state.error_rate = EWMA_ALPHA * congested + (1 - EWMA_ALPHA) * state.error_rate
+
+            if congested:
+                # Multiplicative decrease
+                state.concurrency_limit = max(1.0, state.concurrency_limit / 2)
+                state.delay = min(self.max_delay, max(state.delay * THROTTLE_BACKOFF_FACTOR, retry_after or 0))
+                state.next_allowed = max(state.next_allowed, time.monotonic() + state.delay)
+                logger.debug(f"Backing off {host}: delay {state.delay:.2f}s, "
+                             f"concurrency {int(state.concurrency_limit)} (status {status_code})")
+            elif state.latency > THROTTLE_TARGET_LATENCY:
+                # Host is slowing down, space requests out
+                state.delay = min(self.max_delay, state.delay + THROTTLE_DELAY_STEP)
+            else:
+                # Additive increase
+                state.concurrency_limit = min(
+                    self.host_max_concurrency,
+                    state.concurrency_limit + 1 / state.concurrency_limit
+                )
+                state.delay = max(self.min_delay, state.delay - THROTTLE_DELAY_STEP)
+
+            self._condition.notify_all()
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        Get the current decisions for every host, for monitoring
+
+        Returns:
+            Dict[str, dict]: HostState fields per host, with the effective concurrency
+        """
+        with self._condition:
+            return {
+                host: dict(asdict(state), concurrency=int(state.concurrency_limit))
+                for host, state in self._hosts.items()
+            }
@@ -0,0 +1,166 @@
+import os
+import sys
+import time
+import socket
+import argparse
+from typing import Iterable, List, Optional
+from loguru import logger
+from ..crawler.google_search import GoogleSearchCrawler
+from ..scraper.scraper import Scraper
+from ..utils.data_cleaner import DataCleaner
+from ..export.exporter import Exporter
+from ..models.organizer import Organizer
+from ..utils.log_config import configure_logging
+from .work_queue import WorkQueue
+from ..config import QUEUE_PATH, QUEUE_POLL_INTERVAL, load_environment
+
+class Worker:
+    """Process that leases URLs from the shared queue and scrapes them"""
+
+    def __init__(self, queue: WorkQueue, worker_id: Optional[str] = None):
+        self.queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.scraper = Scraper()
+
+    def run(self, max_tasks: Optional[int] = None, wait: bool = False) -> int:
+        """
+        Process tasks until the queue is drained
+
+        Args:
+            max_tasks (int, optional): Stop after this many tasks
+            wait (bool): Keep polling for new work once the queue is drained
+
+        Returns:
+            int: Number of tasks processed
+        """
+        processed = 0
+        logger.info(f"Worker {self.worker_id} started")
+
+        try:
+            while max_tasks is None or processed < max_tasks:
+                task = self.queue.lease(self.worker_id)
+
+                if task is None:
+                    if not wait and self.queue.is_drained():
+                        break
+                    # Tasks are leased elsewhere or their hosts are cooling down
+                    time.sleep(QUEUE_POLL_INTERVAL)
+                    continue
+
+                try:
+                    organizer = self.scraper.scrape(task.url)
+                    self.queue.ack(task, self.worker_id, organizer)
+                except Exception as e:
+                    logger.error(f"Error scraping {task.url}: {str(e)}")
+                    self.queue.fail(task, self.worker_id, str(e))
+
+                processed += 1
+
+            logger.info(f"Worker {self.worker_id} finished after {processed} tasks")
+            return processed
+
+        finally:
+            self.scraper.close()
+
+class Coordinator:
+    """Discovers URLs, fills the shared queue and merges worker results"""
+
+    def __init__(self, queue: WorkQueue):
+        self.queue = queue
+
+    def submit(self, urls: Iterable[str]) -> int:
+        """
+        Queue URLs for the workers
+
+        Args:
+            urls (Iterable[str]): URLs to scrape
+
+        Returns:
+            int: Number of newly queued URLs
+        """
+        return self.queue.enqueue(urls)
+
+    def discover(self, num_results_per_keyword: int = 10) -> int:
+        """
+        Search for travel agency websites and queue the valid ones
+
+        Args:
+            num_results_per_keyword (int): Number of results to fetch per search keyword
+
+        Returns:
+            int: Number of newly queued URLs
+        """
+        google_crawler = GoogleSearchCrawler()
+        try:
+            websites = google_crawler.search_travel_agencies(num_results_per_keyword)
+            logger.info(f"Found {len(websites)} potential websites")
+
+            valid_websites = google_crawler.filter_valid_websites(websites)
+            logger.info(f"Filtered down to {len(valid_websites)} valid travel websites")
+
+            return self.submit(valid_websites)
+        finally:
+            google_crawler.crawler.close()
+
+    def wait(self):
+        """Block until every queued task is done or failed"""
+        # Also sweeps tasks whose worker died on the last attempt
+        while self.queue.expire_leases() or not self.queue.is_drained():
+            logger.info(f"Waiting for workers: {self.queue.stats()}")
+            time.sleep(QUEUE_POLL_INTERVAL)
+
+    def merge(self) -> List[Organizer]:
+        """
+        Clean and deduplicate all results reported by the workers
+
+        Returns:
+            List[Organizer]: Cleaned list of organizers
+        """
+        organizers = self.queue.results()
+        cleaned_organizers = DataCleaner.clean_dataset(organizers)
+        logger.info(f"Merged {len(organizers)} results into {len(cleaned_organizers)} unique organizers")
+        return cleaned_organizers
+
+def main():
+    """Entry point for coordinator and worker processes"""
+    parser = argparse.ArgumentParser(description="Distributed Haji & Umroh scraping")
+    parser.add_argument('--queue', default=QUEUE_PATH, help="Path to the shared queue database")
+    subparsers = parser.add_subparsers(dest='role', required=True)
+
+    coordinator_parser = subparsers.add_parser('coordinator', help="Queue URLs and merge results")
+    coordinator_parser.add_argument('--urls', help="File with one URL per line (default: Google search)")
+    coordinator_parser.add_argument('--results', type=int, default=10, help="Search results per keyword")
+
+    worker_parser = subparsers.add_parser('worker', help="Scrape URLs from the queue")
+    worker_parser.add_argument('--max-tasks', type=int, help="Stop after this many tasks")
+    worker_parser.add_argument('--wait', action='store_true', help="Keep polling once the queue is drained")
+
+    args = parser.parse_args()
+    load_environment()
+    configure_logging()
+    queue = WorkQueue(args.queue)
+
+    try:
+        if args.role == 'coordinator':
+            coordinator = Coordinator(queue)
+            if args.urls:
+                with open(args.urls, encoding='utf-8') as f:
+                    coordinator.submit(line.strip() for line in f if line.strip())
+            else:
+                coordinator.discover(args.results)
+
+            coordinator.wait()
+            csv_path = Exporter.to_csv(coordinator.merge())
+            logger.info(f"Results saved to: {csv_path}")
+        else:
+            Worker(queue).run(max_tasks=args.max_tasks, wait=args.wait)
+
+    except Exception as e:
+        logger.error(f"Fatal error: {str(e)}")
+        sys.exit(1)
+
+    finally:
+        queue.close()
+
+if __name__ == "__main__":
+    main()
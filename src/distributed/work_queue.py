@@ -0,0 +1,352 @@
+import os
+import json
+import time
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+from loguru import logger
+from ..models.organizer import Organizer
+from ..config import (
+    QUEUE_PATH, QUEUE_LEASE_SECONDS, QUEUE_MAX_ATTEMPTS,
+    HOST_POLITENESS_DELAY, DELAY_BETWEEN_REQUESTS
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL UNIQUE,
+    host TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending'
+        CHECK (status IN ('pending', 'leased', 'done', 'failed')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,
+    available_at REAL NOT NULL,
+    last_error TEXT,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_ready ON tasks(status, available_at);
+
+CREATE TABLE IF NOT EXISTS results (
+    task_id INTEGER PRIMARY KEY REFERENCES tasks(id),
+    organizer TEXT NOT NULL,
+    worker TEXT NOT NULL,
+    finished_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS hosts (
+    host TEXT PRIMARY KEY,
+    next_allowed REAL NOT NULL
+);
+"""
+
+@dataclass
+class Task:
+    """
+    URL leased to a worker
+    """
+    id: int
+    url: str
+    host: str
+    attempts: int
+
+class WorkQueue:
+    """
+    Shared SQLite-backed queue of URLs to scrape, with leases, acknowledgments,
+    retries and per-host politeness enforced across all workers
+
+    Any number of worker processes may open the same database file. A task is
+    leased to one worker at a time; if the worker does not ack or fail it
+    before the lease expires, it becomes available again, or fails for good
+    if that was its last attempt. A host is only
+    leased to one worker at a time, and not again until HOST_POLITENESS_DELAY
+    has passed since its last task finished.
+    """
+
+    def __init__(
+        self,
+        path: str = QUEUE_PATH,
+        lease_seconds: float = QUEUE_LEASE_SECONDS,
+        max_attempts: int = QUEUE_MAX_ATTEMPTS,
+        host_delay: float = HOST_POLITENESS_DELAY
+    ):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.host_delay = host_delay
+
+        # Autocommit mode, transactions are opened explicitly
+        self.conn = sqlite3.connect(path, isolation_level=None, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+
+    def _transaction(self):
+        """Open a write transaction, locking out other writers immediately"""
+        self.conn.execute('BEGIN IMMEDIATE')
+        return self.conn
+
+    def enqueue(self, urls: Iterable[str]) -> int:
+        """
+        Add URLs to the queue, ignoring ones already queued
+
+        Args:
+            urls (Iterable[str]): URLs to scrape
+
+        Returns:
+            int: Number of newly queued URLs
+        """
+        now = time.time()
+        created_at = datetime.now().isoformat()
+        rows = [(url, urlparse(url).netloc.lower(), now, created_at) for url in urls]
+
+        conn = self._transaction()
+        try:
+            before = conn.total_changes
+            conn.executemany(
+                'INSERT OR IGNORE INTO tasks (url, host, available_at, created_at) VALUES (?, ?, ?, ?)',
+                rows
+            )
+            added = conn.total_changes - before
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+        logger.info(f"Queued {added} new URLs ({len(rows) - added} already queued)")
+        return added
+
+    def _fail_expired(self, conn: sqlite3.Connection, now: float) -> int:
+        """
+        Fail expired leases that used up their last attempt, inside an open transaction
+
+        Workers that crash or hang on a task never call fail(), so without
+        this such tasks would be re-leased forever.
+
+        Args:
+            conn (sqlite3.Connection): Connection with an open write transaction
+            now (float): Current time
+
+        Returns:
+            int: Number of tasks failed
+        """
+        expired = conn.execute(
+            """
+            UPDATE tasks
+            SET status = 'failed', lease_owner = NULL, lease_expires = NULL, last_error = 'lease expired'
+            WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?
+            """,
+            (now, self.max_attempts)
+        ).rowcount
+        if expired:
+            logger.error(f"Giving up on {expired} tasks whose last lease expired")
+        return expired
+
+    def expire_leases(self) -> int:
+        """
+        Fail expired leases that used up their last attempt
+
+        Returns:
+            int: Number of tasks failed
+        """
+        conn = self._transaction()
+        try:
+            expired = self._fail_expired(conn, time.time())
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return expired
+
+    def lease(self, worker_id: str) -> Optional[Task]:
+        """
+        Lease the next ready task whose host is not busy or cooling down
+
+        Args:
+            worker_id (str): ID of the worker taking the task
+
+        Returns:
+            Optional[Task]: Leased task, or None if nothing is ready
+        """
+        now = time.time()
+
+        conn = self._transaction()
+        try:
+            self._fail_expired(conn, now)
+
+            row = conn.execute(
+                """
+                SELECT t.id, t.url, t.host, t.attempts FROM tasks t
+                LEFT JOIN hosts h ON h.host = t.host
+                WHERE (t.status = 'pending' OR (t.status = 'leased' AND t.lease_expires < ?))
+                    AND t.available_at <= ?
+                    AND COALESCE(h.next_allowed, 0) <= ?
+                ORDER BY t.available_at, t.id
+                LIMIT 1
+                """,
+                (now, now, now)
+            ).fetchone()
+
+            if row is None:
+                conn.execute('COMMIT')
+                return None
+
+            lease_expires = now + self.lease_seconds
+            conn.execute(
+                """
+                UPDATE tasks
+                SET status = 'leased', lease_owner = ?, lease_expires = ?, attempts = attempts + 1
+                WHERE id = ?
+                """,
+                (worker_id, lease_expires, row['id'])
+            )
+            # Block the host for the whole lease, released on ack/fail
+            conn.execute(
+                """
+                INSERT INTO hosts (host, next_allowed) VALUES (?, ?)
+                ON CONFLICT (host) DO UPDATE SET next_allowed = excluded.next_allowed
+                """,
+                (row['host'], lease_expires)
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+        return Task(id=row['id'], url=row['url'], host=row['host'], attempts=row['attempts'] + 1)
+
+    def _finish(self, task: Task, worker_id: str, update: str, params: tuple, result: Optional[tuple] = None) -> bool:
+        """
+        Update a task still leased by worker_id, store its result and release its host
+
+        Args:
+            task (Task): Task being finished
+            worker_id (str): ID of the worker holding the lease
+            update (str): SET clause applied to the task
+            params (tuple): Parameters for the SET clause
+            result (tuple, optional): Organizer JSON to store in the results table
+
+        Returns:
+            bool: True if applied, False if the lease was lost to another worker
+        """
+        conn = self._transaction()
+        try:
+            cursor = conn.execute(
+                f"UPDATE tasks SET {update} WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                params + (task.id, worker_id)
+            )
+            if cursor.rowcount == 0:
+                conn.execute('ROLLBACK')
+                logger.warning(f"Lease on {task.url} was lost by {worker_id}")
+                return False
+
+            if result:
+                conn.execute(
+                    'INSERT OR REPLACE INTO results (task_id, organizer, worker, finished_at) VALUES (?, ?, ?, ?)',
+                    (task.id,) + result + (worker_id, datetime.now().isoformat())
+                )
+            conn.execute(
+                'UPDATE hosts SET next_allowed = ? WHERE host = ?',
+                (time.time() + self.host_delay, task.host)
+            )
+            conn.execute('COMMIT')
+            return True
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def ack(self, task: Task, worker_id: str, organizer: Optional[Organizer]) -> bool:
+        """
+        Mark a task as done and store its result
+
+        Args:
+            task (Task): Task being acknowledged
+            worker_id (str): ID of the worker holding the lease
+            organizer (Organizer, optional): Scraped organizer, if any
+
+        Returns:
+            bool: True if acknowledged, False if the lease was lost
+        """
+        return self._finish(
+            task,
+            worker_id,
+            "status = 'done', lease_owner = NULL, lease_expires = NULL",
+            (),
+            (json.dumps(organizer.to_dict()),) if organizer else None
+        )
+
+    def fail(self, task: Task, worker_id: str, error: str) -> bool:
+        """
+        Mark a task attempt as failed, retrying it later with backoff until
+        max_attempts is reached
+
+        Args:
+            task (Task): Task that failed
+            worker_id (str): ID of the worker holding the lease
+            error (str): Failure description
+
+        Returns:
+            bool: True if recorded, False if the lease was lost
+        """
+        if task.attempts >= self.max_attempts:
+            logger.error(f"Giving up on {task.url} after {task.attempts} attempts: {error}")
+            return self._finish(
+                task,
+                worker_id,
+                "status = 'failed', lease_owner = NULL, lease_expires = NULL, last_error = ?",
+                (error,)
+            )
+
+        # Exponential backoff
+        logger.info(f"Retrying {task.url} later (attempt {task.attempts}/{self.max_attempts})")
+        return self._finish(
+            task,
+            worker_id,
+            "status = 'pending', lease_owner = NULL, lease_expires = NULL, last_error = ?, available_at = ?",
+            (error, time.time() + DELAY_BETWEEN_REQUESTS * (2 ** task.attempts))
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Count tasks per status
+
+        Returns:
+            Dict[str, int]: Number of pending, leased, done and failed tasks
+        """
+        counts = {'pending': 0, 'leased': 0, 'done': 0, 'failed': 0}
+        for row in self.conn.execute('SELECT status, COUNT(*) AS n FROM tasks GROUP BY status'):
+            counts[row['status']] = row['n']
+        return counts
+
+    def is_drained(self) -> bool:
+        """
+        Check whether every task is done or failed
+
+        Returns:
+            bool: True if no task is pending or leased
+        """
+        stats = self.stats()
+        return stats['pending'] == 0 and stats['leased'] == 0
+
+    def results(self) -> List[Organizer]:
+        """
+        Load all organizers scraped so far
+
+        Returns:
+            List[Organizer]: Organizers from acknowledged tasks
+        """
+        return [
+            Organizer.from_dict(json.loads(row['organizer']))
+            for row in self.conn.execute('SELECT organizer FROM results ORDER BY task_id')
+        ]
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
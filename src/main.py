@@ -1,32 +1,50 @@
 import sys
-from typing import List
+from typing import TYPE_CHECKING, List, Optional
 from loguru import logger
 from .crawler.google_search import GoogleSearchCrawler
 from .scraper.scraper import Scraper
 from .utils.data_cleaner import DataCleaner
+from .utils.log_config import configure_logging
 from .export.exporter import Exporter
 from .models.organizer import Organizer
+from .storage.store import OrganizerStore
+from .config import load_environment
+
+if TYPE_CHECKING:
+    from .crawler.renderer import Renderer
 
 class HajiUmrohScraper:
     """Main class for orchestrating the scraping process"""
     
     def __init__(self):
-        # Configure logger
-        logger.remove()  # Remove default handler
-        logger.add(sys.stdout, format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>")
-        logger.add("scraper.log", rotation="500 MB")
+        # Configure logger (console + file, see LOG_* settings in config)
+        configure_logging()
+        
+        # Store run ID of the last run(), for "new/changed since" queries
+        self.last_run_id: Optional[int] = None
 
-    def run(self, num_results_per_keyword: int = 10) -> str:
+    def run(
+        self,
+        num_results_per_keyword: int = 10,
+        store: Optional[OrganizerStore] = None,
+        renderer: Optional['Renderer'] = None
+    ) -> str:
         """
         Run the complete scraping process
         
         Args:
             num_results_per_keyword (int): Number of results to fetch per search keyword
+            store (OrganizerStore, optional): Persistent store to upsert results into,
+                the run's ID is kept in last_run_id
+            renderer (Renderer, optional): Headless renderer for JavaScript-only sites
             
         Returns:
             str: Path to the exported CSV file
         """
         try:
+            run_id = store.start_run() if store else None
+            self.last_run_id = run_id
+            
             # Step 1: Search for travel agency websites
             logger.info("Starting website search...")
             google_crawler = GoogleSearchCrawler()
@@ -39,16 +57,19 @@ class HajiUmrohScraper:
             
             # Step 3: Scrape contact information
             logger.info("Starting contact information scraping...")
-            scraper = Scraper()
+            scraper = Scraper(renderer=renderer)
             organizers: List[Organizer] = []
             
             for url in valid_websites:
                 try:
-                    organizer = scraper.scrape_page(url)
-                    if organizer:
-                        organizers.append(organizer)
+                    organizer = scraper.scrape(url)
+                    organizers.append(organizer)
+                    if store:
+                        store.record_fetch(run_id, url, True)
                 except Exception as e:
                     logger.error(f"Error scraping {url}: {str(e)}")
+                    if store:
+                        store.record_fetch(run_id, url, False, str(e))
                     continue
             
             logger.info(f"Successfully scraped {len(organizers)} organizers")
@@ -59,7 +80,13 @@ class HajiUmrohScraper:
             cleaned_organizers = cleaner.clean_dataset(organizers)
             logger.info(f"Data cleaned, {len(cleaned_organizers)} unique organizers remaining")
             
-            # Step 5: Export to CSV
+            # Step 5: Persist to the organizer store
+            if store:
+                logger.info("Saving results to organizer store...")
+                store.upsert_organizers(cleaned_organizers, run_id)
+                store.finish_run(run_id)
+            
+            # Step 6: Export to CSV
             logger.info("Exporting results to CSV...")
             csv_path = Exporter.to_csv(cleaned_organizers)
             logger.info(f"Results exported to {csv_path}")
@@ -80,6 +107,7 @@ class HajiUmrohScraper:
 def main():
     """Entry point for the scraper"""
     try:
+        load_environment()
         scraper = HajiUmrohScraper()
         csv_path = scraper.run()
         logger.info("Scraping completed successfully!")
@@ -0,0 +1,107 @@
+import time
+import threading
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Set
+from loguru import logger
+from ..models.organizer import Organizer
+from .scraper import Scraper, ScrapeError
+from ..config import SCRAPE_CONCURRENCY
+
+if TYPE_CHECKING:
+    from ..crawler.renderer import Renderer
+
+@dataclass
+class ScrapeResult:
+    """
+    Outcome of scraping a single website
+    """
+    url: str
+    status: str  # 'ok', 'no_data' (loaded, no contacts) or 'error'
+    latency: float  # seconds
+    organizer: Optional[Organizer] = None
+    error: Optional[str] = None
+
+    def to_dict(self):
+        """Convert the result to a dictionary"""
+        return {
+            'url': self.url,
+            'status': self.status,
+            'latency_ms': round(self.latency * 1000, 1),
+            'error': self.error,
+            'organizer': self.organizer.to_dict() if self.organizer else None
+        }
+
+def scrape_many(
+    urls: Iterable[str],
+    concurrency: int = SCRAPE_CONCURRENCY,
+    timeout: Optional[float] = None,
+    renderer: Optional['Renderer'] = None
+) -> Iterator[ScrapeResult]:
+    """
+    Scrape many websites in parallel, yielding results as they finish
+
+    URLs are consumed lazily and at most `concurrency` are in flight at once,
+    so very long lists (or stdin) never have to be held in memory. Each worker
+    thread reuses its own Scraper and HTTP session.
+
+    Args:
+        urls (Iterable[str]): Website URLs to scrape
+        concurrency (int): Maximum number of websites scraped at once
+        timeout (float, optional): Per-request timeout in seconds, defaults to REQUEST_TIMEOUT
+        renderer (Renderer, optional): Headless renderer for JavaScript-only sites
+
+    Yields:
+        ScrapeResult: Result for each URL, in completion order
+    """
+    local = threading.local()
+    scrapers: List[Scraper] = []
+    scrapers_lock = threading.Lock()
+
+    def scrape(url: str) -> ScrapeResult:
+        if not hasattr(local, 'scraper'):
+            local.scraper = Scraper(renderer=renderer, timeout=timeout)
+            with scrapers_lock:
+                scrapers.append(local.scraper)
+
+        start = time.perf_counter()
+        try:
+            organizer = local.scraper.scrape(url)
+            return ScrapeResult(
+                url=url,
+                status='ok' if organizer.phone_numbers or organizer.emails else 'no_data',
+                latency=time.perf_counter() - start,
+                organizer=organizer
+            )
+        except ScrapeError as e:
+            logger.warning(str(e))
+            return ScrapeResult(url=url, status='error', latency=time.perf_counter() - start, error=str(e))
+        except Exception as e:
+            logger.error(f"Error scraping {url}: {str(e)}")
+            return ScrapeResult(url=url, status='error', latency=time.perf_counter() - start, error=str(e))
+
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='scrape')
+    pending: Set[Future] = set()
+
+    try:
+        for url in urls:
+            pending.add(executor.submit(scrape, url))
+
+            # Keep the window bounded before reading more URLs
+            while len(pending) >= concurrency:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+    finally:
+        # Consumer may stop early; drop queued work and release sessions
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+        for scraper in scrapers:
+            scraper.close()
@@ -1,16 +1,40 @@
 import re
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 from bs4 import BeautifulSoup
 from loguru import logger
 from ..models.organizer import Organizer
-from ..utils.validators import validate_email, validate_phone, validate_url
+from ..utils.validators import validate_email, validate_phone, validate_url, is_local_url
 from ..crawler.crawler import Crawler
+from .structured_data import StructuredDataExtractor
+
+if TYPE_CHECKING:
+    # Only needed for annotations, keeps asyncio out of the import path
+    from ..crawler.renderer import Renderer
+
+class ScrapeError(Exception):
+    """Raised when a website cannot be scraped, with the cause as message"""
 
 class Scraper:
     """Class for scraping contact information from travel agency websites"""
     
-    def __init__(self):
-        self.crawler = Crawler()
+    def __init__(
+        self,
+        renderer: Optional['Renderer'] = None,
+        timeout: Optional[float] = None,
+        allow_local: bool = False
+    ):
+        """
+        Args:
+            renderer (Renderer, optional): Headless renderer used when static
+                extraction finds no contacts. The caller owns and closes it.
+            timeout (float, optional): Per-request timeout in seconds, defaults to REQUEST_TIMEOUT
+            allow_local (bool): Accept loopback URLs such as http://localhost,
+                e.g. for local fixture pages
+        """
+        self.crawler = Crawler(timeout=timeout)
+        self.structured_data = StructuredDataExtractor()
+        self.renderer = renderer
+        self.allow_local = allow_local
 
     def extract_phones(self, text: str) -> List[str]:
         """
@@ -135,34 +159,48 @@ class Scraper:
         
         return domain
 
-    def scrape_page(self, url: str) -> Optional[Organizer]:
+    def scrape(self, url: str) -> Organizer:
         """
-        Scrape contact information from a website
+        Scrape contact information from a website, raising on failure
         
         Args:
             url (str): Website URL to scrape
             
         Returns:
-            Optional[Organizer]: Organizer instance if successful, None otherwise
-        """
-        try:
-            # Validate URL
-            if not validate_url(url):
-                logger.warning(f"Invalid URL: {url}")
-                return None
-            
-            # Get homepage content
-            content = self.crawler.get_page(url)
-            if not content:
-                return None
+            Organizer: Organizer found, possibly without any contacts
             
+        Raises:
+            ScrapeError: If the URL is invalid or the homepage cannot be fetched
+        """
+        # Validate URL
+        if not validate_url(url) and not (self.allow_local and is_local_url(url)):
+            raise ScrapeError(f"Invalid URL: {url}")
+        
+        # Get homepage content
+        content = self.crawler.get_page(url)
+        if not content:
+            raise ScrapeError(f"Failed to fetch {url}")
+        
+        # Structured data is cheap to scan and the most reliable source
+        structured = self.structured_data.extract(content)
+        # Extract per value, joined values would run into each other
+        structured_phones = [phone for value in structured.phones for phone in self.extract_phones(value)]
+        structured_emails = [email for value in structured.emails for email in self.extract_emails(value)]
+        
+        phones = self.extract_phones(content) + structured_phones
+        emails = self.extract_emails(content) + structured_emails
+        
+        if structured_phones and structured_emails and structured.address:
+            # Complete contacts declared, skip the heuristics and contact page
+            logger.debug(f"Using structured data for {url}")
+            name = structured.name or self.extract_name(BeautifulSoup(content, 'html.parser'), url)
+            address = structured.address
+        else:
             soup = BeautifulSoup(content, 'html.parser')
             
             # Extract initial information from homepage
-            name = self.extract_name(soup, url)
-            phones = self.extract_phones(content)
-            emails = self.extract_emails(content)
-            address = self.extract_address(soup)
+            name = structured.name or self.extract_name(soup, url)
+            address = structured.address or self.extract_address(soup)
             
             # Try to get additional information from contact page
             contact_content = self.crawler.get_contact_page(url)
@@ -176,17 +214,40 @@ class Scraper:
                 # Update address if not found on homepage
                 if not address:
                     address = self.extract_address(contact_soup)
+        
+        # Fall back to a rendered page when contacts are injected by JavaScript
+        if not phones and not emails and self.renderer:
+            logger.info(f"No static contacts found, rendering {url}")
+            rendered = self.renderer.render(url)
+            if rendered:
+                phones.extend(self.extract_phones(rendered))
+                emails.extend(self.extract_emails(rendered))
+                if not address:
+                    address = self.extract_address(BeautifulSoup(rendered, 'html.parser'))
+        
+        # Create Organizer instance
+        organizer = Organizer(
+            name=name,
+            website_url=url,
+            address=address,
+            phone_numbers=list(set(phones)),  # Remove duplicates
+            emails=list(set(emails))  # Remove duplicates
+        )
+        
+        return organizer
+
+    def scrape_page(self, url: str) -> Optional[Organizer]:
+        """
+        Scrape contact information from a website
+        
+        Args:
+            url (str): Website URL to scrape
             
-            # Create Organizer instance
-            organizer = Organizer(
-                name=name,
-                website_url=url,
-                address=address,
-                phone_numbers=list(set(phones)),  # Remove duplicates
-                emails=list(set(emails))  # Remove duplicates
-            )
-            
-            return organizer
+        Returns:
+            Optional[Organizer]: Organizer instance if successful, None otherwise
+        """
+        try:
+            return self.scrape(url)
             
         except Exception as e:
             logger.error(f"Error scraping {url}: {str(e)}")
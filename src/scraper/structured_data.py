@@ -0,0 +1,252 @@
+import re
+import json
+from html import unescape
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+from loguru import logger
+
+# Cheap scans over the raw HTML, no DOM parsing required
+JSON_LD_PATTERN = re.compile(
+    r'<script[^>]*type\s*=\s*["\']?application/ld\+json["\']?[^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL
+)
+META_TAG_PATTERN = re.compile(r'<meta\s[^>]*>', re.IGNORECASE)
+ITEMPROP_PATTERN = re.compile(
+    r'<[a-z][^>]*\bitemprop\s*=\s*["\']?(telephone|email|streetAddress|addressLocality|addressRegion|postalCode)\b[^>]*>([^<]*)',
+    re.IGNORECASE
+)
+ATTRIBUTE_PATTERN = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))')
+
+# schema.org types describing the organizer itself
+ORGANIZATION_TYPES = {
+    'organization',
+    'travelagency',
+    'localbusiness',
+    'corporation',
+    'professionalservice'
+}
+
+# PostalAddress parts, in display order
+ADDRESS_PARTS = ['streetAddress', 'addressLocality', 'addressRegion', 'postalCode', 'addressCountry']
+
+# Meta tag properties mapped to the field they provide
+META_PROPERTIES = {
+    'og:site_name': 'name',
+    'og:phone_number': 'phone',
+    'og:email': 'email',
+    'og:street-address': 'streetAddress',
+    'og:locality': 'addressLocality',
+    'og:region': 'addressRegion',
+    'og:postal-code': 'postalCode',
+    'business:contact_data:phone_number': 'phone',
+    'business:contact_data:email': 'email',
+    'business:contact_data:street_address': 'streetAddress',
+    'business:contact_data:locality': 'addressLocality',
+    'business:contact_data:region': 'addressRegion',
+    'business:contact_data:postal_code': 'postalCode'
+}
+
+@dataclass
+class StructuredData:
+    """
+    Contact information declared in a page's structured data
+    """
+    name: Optional[str] = None
+    address: Optional[str] = None
+    phones: List[str] = field(default_factory=list)
+    emails: List[str] = field(default_factory=list)
+
+class StructuredDataExtractor:
+    """Class for extracting contacts from JSON-LD, microdata and meta tags"""
+
+    @staticmethod
+    def _attributes(tag: str) -> Dict[str, str]:
+        """
+        Parse the attributes of a single HTML tag
+
+        Args:
+            tag (str): Raw tag markup
+
+        Returns:
+            Dict[str, str]: Lowercase attribute names mapped to unescaped values
+        """
+        return {
+            match.group(1).lower(): unescape(next(value for value in match.groups()[1:] if value is not None))
+            for match in ATTRIBUTE_PATTERN.finditer(tag)
+        }
+
+    @staticmethod
+    def _strip_scheme(value: str) -> str:
+        """
+        Remove mailto:/tel: prefixes from a contact value
+
+        Args:
+            value (str): Raw contact value
+
+        Returns:
+            str: Contact value without URI scheme
+        """
+        value = value.strip()
+        return re.sub(r'^(?:mailto|tel):', '', value, flags=re.IGNORECASE)
+
+    @staticmethod
+    def _as_list(value: Any) -> List[Any]:
+        """Wrap a scalar JSON-LD value in a list"""
+        if value is None:
+            return []
+        return value if isinstance(value, list) else [value]
+
+    @staticmethod
+    def _format_address(address: Any) -> Optional[str]:
+        """
+        Format a schema.org address as a single line
+
+        Args:
+            address (Any): Address string or PostalAddress object
+
+        Returns:
+            Optional[str]: Formatted address if present, None otherwise
+        """
+        if isinstance(address, list):
+            address = address[0] if address else None
+        if isinstance(address, str):
+            return ' '.join(address.split()) or None
+        if isinstance(address, dict):
+            parts = [str(address[part]).strip() for part in ADDRESS_PARTS
+                     if isinstance(address.get(part), (str, int))]
+            return ', '.join(part for part in parts if part) or None
+        return None
+
+    def _walk_json_ld(self, node: Any) -> Iterator[dict]:
+        """
+        Yield every JSON-LD node describing an organization
+
+        Args:
+            node (Any): Parsed JSON-LD document or fragment
+
+        Yields:
+            dict: Organization nodes
+        """
+        if isinstance(node, list):
+            for item in node:
+                yield from self._walk_json_ld(item)
+        elif isinstance(node, dict):
+            types = {str(t).lower() for t in self._as_list(node.get('@type'))}
+            if types & ORGANIZATION_TYPES:
+                yield node
+            for key, value in node.items():
+                if isinstance(value, (dict, list)) and key not in ('address', 'contactPoint'):
+                    yield from self._walk_json_ld(value)
+
+    def extract_json_ld(self, html: str, data: StructuredData):
+        """
+        Extract contacts from application/ld+json blocks
+
+        Args:
+            html (str): Raw HTML content
+            data (StructuredData): Result to fill in
+        """
+        for match in JSON_LD_PATTERN.finditer(html):
+            try:
+                document = json.loads(match.group(1).strip())
+            except ValueError:
+                logger.debug("Skipping malformed JSON-LD block")
+                continue
+
+            for node in self._walk_json_ld(document):
+                if not data.name and isinstance(node.get('name'), str):
+                    data.name = node['name'].strip() or None
+                if not data.address:
+                    data.address = self._format_address(node.get('address'))
+
+                # Contact points carry the same fields as the organization
+                for source in [node] + [point for point in self._as_list(node.get('contactPoint'))
+                                        if isinstance(point, dict)]:
+                    data.phones.extend(self._strip_scheme(phone) for phone in self._as_list(source.get('telephone'))
+                                       if isinstance(phone, str))
+                    data.emails.extend(self._strip_scheme(email) for email in self._as_list(source.get('email'))
+                                       if isinstance(email, str))
+
+    def extract_microdata(self, html: str, data: StructuredData):
+        """
+        Extract contacts from schema.org microdata attributes
+
+        Args:
+            html (str): Raw HTML content
+            data (StructuredData): Result to fill in
+        """
+        address_parts: Dict[str, str] = {}
+
+        for match in ITEMPROP_PATTERN.finditer(html):
+            prop = match.group(1)
+            attributes = self._attributes(match.group(0).split('>', 1)[0])
+            value = attributes.get('content') or attributes.get('href') or unescape(match.group(2))
+            value = self._strip_scheme(value)
+            if not value:
+                continue
+
+            if prop == 'telephone':
+                data.phones.append(value)
+            elif prop == 'email':
+                data.emails.append(value)
+            else:
+                address_parts.setdefault(prop, value)
+
+        if not data.address and address_parts:
+            data.address = self._format_address(address_parts)
+
+    def extract_meta_tags(self, html: str, data: StructuredData):
+        """
+        Extract contacts from Open Graph and business meta tags
+
+        Args:
+            html (str): Raw HTML content
+            data (StructuredData): Result to fill in
+        """
+        address_parts: Dict[str, str] = {}
+
+        for tag in META_TAG_PATTERN.findall(html):
+            attributes = self._attributes(tag)
+            key = META_PROPERTIES.get((attributes.get('property') or attributes.get('name') or '').lower())
+            value = (attributes.get('content') or '').strip()
+            if not key or not value:
+                continue
+
+            if key == 'name':
+                data.name = data.name or value
+            elif key == 'phone':
+                data.phones.append(self._strip_scheme(value))
+            elif key == 'email':
+                data.emails.append(self._strip_scheme(value))
+            else:
+                address_parts.setdefault(key, value)
+
+        if not data.address and address_parts:
+            data.address = self._format_address(address_parts)
+
+    def extract(self, html: str) -> StructuredData:
+        """
+        Extract all structured contact data from a page
+
+        Sources are applied in order of reliability: JSON-LD, microdata,
+        then meta tags. Earlier sources win for name and address; phones
+        and emails are collected from all of them.
+
+        Args:
+            html (str): Raw HTML content
+
+        Returns:
+            StructuredData: Structured contact data found on the page
+        """
+        data = StructuredData()
+
+        try:
+            self.extract_json_ld(html, data)
+            self.extract_microdata(html, data)
+            self.extract_meta_tags(html, data)
+        except Exception as e:
+            logger.error(f"Error extracting structured data: {str(e)}")
+
+        data.phones = list(dict.fromkeys(data.phones))
+        data.emails = list(dict.fromkeys(data.emails))
+        return data
@@ -0,0 +1,488 @@
+import os
+import sqlite3
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+from urllib.parse import urlparse
+from loguru import logger
+from ..models.organizer import Organizer
+from ..config import DATABASE_PATH
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    finished_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS organizers (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    domain TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    website_url TEXT NOT NULL,
+    address TEXT,
+    created_at TEXT NOT NULL,
+    first_seen_run INTEGER NOT NULL REFERENCES runs(id),
+    last_seen_run INTEGER NOT NULL REFERENCES runs(id),
+    last_changed_run INTEGER NOT NULL REFERENCES runs(id)
+);
+CREATE INDEX IF NOT EXISTS idx_organizers_first_seen ON organizers(first_seen_run);
+CREATE INDEX IF NOT EXISTS idx_organizers_last_changed ON organizers(last_changed_run);
+
+CREATE TABLE IF NOT EXISTS contacts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    organizer_id INTEGER NOT NULL REFERENCES organizers(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL CHECK (kind IN ('phone', 'email')),
+    value TEXT NOT NULL,
+    first_seen_run INTEGER NOT NULL REFERENCES runs(id),
+    last_seen_run INTEGER NOT NULL REFERENCES runs(id),
+    UNIQUE (organizer_id, kind, value)
+);
+CREATE INDEX IF NOT EXISTS idx_contacts_value ON contacts(kind, value);
+
+CREATE TABLE IF NOT EXISTS fetches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    url TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    success INTEGER NOT NULL,
+    error TEXT,
+    fetched_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_fetches_run ON fetches(run_id);
+CREATE INDEX IF NOT EXISTS idx_fetches_domain ON fetches(domain);
+
+CREATE TABLE IF NOT EXISTS changes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    organizer_id INTEGER NOT NULL REFERENCES organizers(id) ON DELETE CASCADE,
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    field TEXT NOT NULL,
+    old_value TEXT,
+    new_value TEXT,
+    changed_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_changes_run ON changes(run_id);
+CREATE INDEX IF NOT EXISTS idx_changes_organizer ON changes(organizer_id);
+"""
+
+# Keep IN (...) lists well below SQLite's host parameter limit
+QUERY_CHUNK_SIZE = 500
+
+class OrganizerStore:
+    """
+    Embedded SQLite store for organizers, their contacts and fetch history
+    """
+
+    # Scalar organizer fields tracked in the change history
+    TRACKED_FIELDS = ('name', 'website_url', 'address')
+
+    # Contact kinds mapped to the Organizer attribute holding them
+    CONTACT_FIELDS = {
+        'phone': 'phone_numbers',
+        'email': 'emails'
+    }
+
+    def __init__(self, path: str = DATABASE_PATH):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA foreign_keys=ON')
+        self.conn.executescript(SCHEMA)
+
+    @staticmethod
+    def extract_domain(url: str) -> str:
+        """
+        Extract the normalized domain used as the organizer key
+
+        Args:
+            url (str): Website URL
+
+        Returns:
+            str: Lowercase host name without a leading 'www.'
+        """
+        domain = urlparse(url).netloc.lower()
+        if domain.startswith('www.'):
+            domain = domain[4:]
+        return domain
+
+    def start_run(self) -> int:
+        """
+        Register a new scraping run
+
+        Returns:
+            int: ID of the new run
+        """
+        with self.conn:
+            cursor = self.conn.execute(
+                'INSERT INTO runs (started_at) VALUES (?)',
+                (datetime.now().isoformat(),)
+            )
+        return cursor.lastrowid
+
+    def finish_run(self, run_id: int):
+        """
+        Mark a scraping run as finished
+
+        Args:
+            run_id (int): ID of the run to finish
+        """
+        with self.conn:
+            self.conn.execute(
+                'UPDATE runs SET finished_at = ? WHERE id = ?',
+                (datetime.now().isoformat(), run_id)
+            )
+
+    def runs(self) -> List[dict]:
+        """
+        List all scraping runs, oldest first
+
+        Returns:
+            List[dict]: Run records with id, started_at, finished_at and number of fetches
+        """
+        rows = self.conn.execute(
+            """
+            SELECT r.id, r.started_at, r.finished_at, COUNT(f.id) AS fetches
+            FROM runs r LEFT JOIN fetches f ON f.run_id = r.id
+            GROUP BY r.id
+            ORDER BY r.id
+            """
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def latest_run(self, finished: bool = True) -> Optional[int]:
+        """
+        Get the ID of the most recent run
+
+        Args:
+            finished (bool): Only consider runs that completed
+
+        Returns:
+            Optional[int]: Run ID, or None if there is no such run
+        """
+        query = 'SELECT MAX(id) FROM runs'
+        if finished:
+            query += ' WHERE finished_at IS NOT NULL'
+        return self.conn.execute(query).fetchone()[0]
+
+    def record_fetch(self, run_id: int, url: str, success: bool, error: Optional[str] = None):
+        """
+        Record the outcome of scraping a single website
+
+        Args:
+            run_id (int): ID of the current run
+            url (str): Website URL that was scraped
+            success (bool): Whether an organizer was extracted
+            error (str, optional): Error message if the scrape failed
+        """
+        with self.conn:
+            self.conn.execute(
+                'INSERT INTO fetches (run_id, url, domain, success, error, fetched_at) VALUES (?, ?, ?, ?, ?, ?)',
+                (run_id, url, self.extract_domain(url), int(success), error, datetime.now().isoformat())
+            )
+
+    def _load_current(self, domains: List[str]) -> Dict[str, dict]:
+        """
+        Load stored organizers and their current contacts for the given domains
+
+        Args:
+            domains (List[str]): Domains to look up
+
+        Returns:
+            Dict[str, dict]: Stored rows keyed by domain, with contact sets per kind
+        """
+        current: Dict[str, dict] = {}
+
+        for start in range(0, len(domains), QUERY_CHUNK_SIZE):
+            chunk = domains[start:start + QUERY_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+
+            for row in self.conn.execute(
+                f'SELECT * FROM organizers WHERE domain IN ({placeholders})', chunk
+            ):
+                record = dict(row)
+                for kind in self.CONTACT_FIELDS:
+                    record[kind] = set()
+                current[row['domain']] = record
+
+            # Current contacts are those seen in the organizer's latest run
+            for row in self.conn.execute(
+                f"""
+                SELECT o.domain, c.kind, c.value
+                FROM contacts c JOIN organizers o ON o.id = c.organizer_id
+                WHERE o.domain IN ({placeholders}) AND c.last_seen_run = o.last_seen_run
+                """,
+                chunk
+            ):
+                current[row['domain']][row['kind']].add(row['value'])
+
+        return current
+
+    def upsert_organizers(self, organizers: Iterable[Organizer], run_id: int) -> Dict[str, int]:
+        """
+        Insert or update organizers in bulk, recording per-field changes
+
+        Organizers are keyed by domain; if the same domain appears more than
+        once in the batch, the last occurrence wins.
+
+        Args:
+            organizers (Iterable[Organizer]): Organizers to store
+            run_id (int): ID of the run that produced them
+
+        Returns:
+            Dict[str, int]: Number of inserted, updated and unchanged organizers
+        """
+        batch: Dict[str, Organizer] = {}
+        for org in organizers:
+            batch[self.extract_domain(org.website_url)] = org
+
+        stats = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        if not batch:
+            return stats
+
+        try:
+            current = self._load_current(list(batch))
+            now = datetime.now().isoformat()
+            change_rows = []
+            contact_rows = []
+
+            with self.conn:
+                for domain, org in batch.items():
+                    incoming: Dict[str, Set[str]] = {
+                        kind: set(getattr(org, field))
+                        for kind, field in self.CONTACT_FIELDS.items()
+                    }
+                    existing = current.get(domain)
+
+                    if existing is None:
+                        cursor = self.conn.execute(
+                            """
+                            INSERT INTO organizers
+                                (domain, name, website_url, address, created_at,
+                                 first_seen_run, last_seen_run, last_changed_run)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                            """,
+                            (domain, org.name, org.website_url, org.address,
+                             org.created_at.isoformat(), run_id, run_id, run_id)
+                        )
+                        organizer_id = cursor.lastrowid
+                        stats['inserted'] += 1
+                    else:
+                        organizer_id = existing['id']
+                        changes = [
+                            (field, existing[field], getattr(org, field))
+                            for field in self.TRACKED_FIELDS
+                            if existing[field] != getattr(org, field)
+                        ]
+                        for kind, field in self.CONTACT_FIELDS.items():
+                            if existing[kind] != incoming[kind]:
+                                changes.append((
+                                    field,
+                                    '; '.join(sorted(existing[kind])),
+                                    '; '.join(sorted(incoming[kind]))
+                                ))
+
+                        if changes:
+                            self.conn.execute(
+                                """
+                                UPDATE organizers
+                                SET name = ?, website_url = ?, address = ?,
+                                    last_seen_run = ?, last_changed_run = ?
+                                WHERE id = ?
+                                """,
+                                (org.name, org.website_url, org.address, run_id, run_id, organizer_id)
+                            )
+                            change_rows.extend(
+                                (organizer_id, run_id, field, old, new, now)
+                                for field, old, new in changes
+                            )
+                            stats['updated'] += 1
+                        else:
+                            self.conn.execute(
+                                'UPDATE organizers SET last_seen_run = ? WHERE id = ?',
+                                (run_id, organizer_id)
+                            )
+                            stats['unchanged'] += 1
+
+                    for kind, values in incoming.items():
+                        contact_rows.extend(
+                            (organizer_id, kind, value, run_id, run_id) for value in values
+                        )
+
+                self.conn.executemany(
+                    """
+                    INSERT INTO contacts (organizer_id, kind, value, first_seen_run, last_seen_run)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (organizer_id, kind, value)
+                    DO UPDATE SET last_seen_run = excluded.last_seen_run
+                    """,
+                    contact_rows
+                )
+                self.conn.executemany(
+                    """
+                    INSERT INTO changes (organizer_id, run_id, field, old_value, new_value, changed_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    change_rows
+                )
+
+            logger.info(
+                f"Stored {len(batch)} organizers in run {run_id}: "
+                f"{stats['inserted']} new, {stats['updated']} changed, {stats['unchanged']} unchanged"
+            )
+            return stats
+
+        except Exception as e:
+            logger.error(f"Error upserting organizers: {str(e)}")
+            raise
+
+    def _to_organizers(self, rows: List[sqlite3.Row]) -> List[Organizer]:
+        """
+        Build Organizer instances from stored rows and their current contacts
+
+        Args:
+            rows (List[sqlite3.Row]): Rows from the organizers table
+
+        Returns:
+            List[Organizer]: Organizers with their current contacts
+        """
+        contacts: Dict[int, Dict[str, List[str]]] = {
+            row['id']: {kind: [] for kind in self.CONTACT_FIELDS} for row in rows
+        }
+        ids = list(contacts)
+
+        for start in range(0, len(ids), QUERY_CHUNK_SIZE):
+            chunk = ids[start:start + QUERY_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            for row in self.conn.execute(
+                f"""
+                SELECT c.organizer_id, c.kind, c.value
+                FROM contacts c JOIN organizers o ON o.id = c.organizer_id
+                WHERE c.organizer_id IN ({placeholders}) AND c.last_seen_run = o.last_seen_run
+                ORDER BY c.id
+                """,
+                chunk
+            ):
+                contacts[row['organizer_id']][row['kind']].append(row['value'])
+
+        return [
+            Organizer(
+                name=row['name'],
+                website_url=row['website_url'],
+                address=row['address'],
+                phone_numbers=contacts[row['id']]['phone'],
+                emails=contacts[row['id']]['email'],
+                created_at=datetime.fromisoformat(row['created_at'])
+            )
+            for row in rows
+        ]
+
+    def get_organizer(self, url: str) -> Optional[Organizer]:
+        """
+        Look up a stored organizer by website URL or domain
+
+        Args:
+            url (str): Website URL or bare domain
+
+        Returns:
+            Optional[Organizer]: Stored organizer if found, None otherwise
+        """
+        domain = self.extract_domain(url if '//' in url else f"//{url}")
+        rows = self.conn.execute('SELECT * FROM organizers WHERE domain = ?', (domain,)).fetchall()
+        organizers = self._to_organizers(rows)
+        return organizers[0] if organizers else None
+
+    def find_by_contact(self, kind: str, value: str) -> List[Organizer]:
+        """
+        Find organizers that have ever listed a given phone number or email
+
+        Args:
+            kind (str): Contact kind, either 'phone' or 'email'
+            value (str): Cleaned phone number or email address
+
+        Returns:
+            List[Organizer]: Matching organizers
+        """
+        rows = self.conn.execute(
+            """
+            SELECT DISTINCT o.* FROM organizers o
+            JOIN contacts c ON c.organizer_id = o.id
+            WHERE c.kind = ? AND c.value = ?
+            """,
+            (kind, value)
+        ).fetchall()
+        return self._to_organizers(rows)
+
+    def all_organizers(self) -> List[Organizer]:
+        """
+        Get every stored organizer
+
+        Returns:
+            List[Organizer]: All organizers with their current contacts
+        """
+        rows = self.conn.execute('SELECT * FROM organizers ORDER BY id').fetchall()
+        return self._to_organizers(rows)
+
+    def new_since(self, run_id: int) -> List[Organizer]:
+        """
+        Get organizers first seen after a given run
+
+        Args:
+            run_id (int): Reference run ID
+
+        Returns:
+            List[Organizer]: Organizers discovered after the run
+        """
+        rows = self.conn.execute(
+            'SELECT * FROM organizers WHERE first_seen_run > ? ORDER BY id', (run_id,)
+        ).fetchall()
+        return self._to_organizers(rows)
+
+    def changed_since(self, run_id: int) -> List[Organizer]:
+        """
+        Get previously known organizers whose data changed after a given run
+
+        Args:
+            run_id (int): Reference run ID
+
+        Returns:
+            List[Organizer]: Organizers updated after the run
+        """
+        rows = self.conn.execute(
+            """
+            SELECT * FROM organizers
+            WHERE last_changed_run > ? AND first_seen_run <= ?
+            ORDER BY id
+            """,
+            (run_id, run_id)
+        ).fetchall()
+        return self._to_organizers(rows)
+
+    def changes_since(self, run_id: int) -> List[dict]:
+        """
+        Get the per-field change history recorded after a given run
+
+        Args:
+            run_id (int): Reference run ID
+
+        Returns:
+            List[dict]: Change records with domain, run_id, field, old_value, new_value and changed_at
+        """
+        rows = self.conn.execute(
+            """
+            SELECT o.domain, ch.run_id, ch.field, ch.old_value, ch.new_value, ch.changed_at
+            FROM changes ch JOIN organizers o ON o.id = ch.organizer_id
+            WHERE ch.run_id > ?
+            ORDER BY ch.id
+            """,
+            (run_id,)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
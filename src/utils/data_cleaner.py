@@ -1,6 +1,9 @@
 from typing import List, Dict
 from ..models.organizer import Organizer
-from .validators import clean_phone_number, clean_email, validate_phone, validate_email
+from .validators import (
+    clean_phone_number, clean_phone_numbers, clean_email,
+    validate_phone, validate_phones, validate_email, validate_emails
+)
 
 class DataCleaner:
     """
@@ -40,6 +43,52 @@ class DataCleaner:
 
         return organizer
 
+    @staticmethod
+    def clean_organizers(organizers: List[Organizer], fast_syntax: bool = True) -> List[Organizer]:
+        """
+        Clean many organizers at once, producing the same result as
+        calling clean_organizer on each of them
+        
+        Distinct phone numbers and emails across all organizers are
+        normalized and validated once as columns, then mapped back.
+        
+        Args:
+            organizers (List[Organizer]): Organizer instances to clean
+            fast_syntax (bool): Use the memoized validate_email_syntax instead of validate_email
+        
+        Returns:
+            List[Organizer]: Cleaned organizer instances
+        """
+        # Collect distinct raw values into columns
+        raw_phones = list({phone for org in organizers for phone in org.phone_numbers})
+        raw_emails = list({email for org in organizers for email in org.emails})
+        
+        # Normalize and validate whole columns, mapping raw -> cleaned (None if invalid)
+        phones = clean_phone_numbers(raw_phones)
+        emails = [clean_email(email) for email in raw_emails]
+        phone_map = {
+            raw: phone if valid else None
+            for raw, phone, valid in zip(raw_phones, phones, validate_phones(phones))
+        }
+        email_map = {
+            raw: email if valid else None
+            for raw, email, valid in zip(raw_emails, emails, validate_emails(emails, fast_syntax=fast_syntax))
+        }
+        
+        for organizer in organizers:
+            organizer.phone_numbers = list(dict.fromkeys(
+                phone for phone in map(phone_map.get, organizer.phone_numbers) if phone
+            ))
+            organizer.emails = list(dict.fromkeys(
+                email for email in map(email_map.get, organizer.emails) if email
+            ))
+            
+            # Clean address (remove extra whitespace)
+            if organizer.address:
+                organizer.address = ' '.join(organizer.address.split())
+        
+        return organizers
+
     @staticmethod
     def remove_duplicates(organizers: List[Organizer]) -> List[Organizer]:
         """
@@ -93,8 +142,8 @@ class DataCleaner:
         Returns:
             List[Organizer]: Cleaned list of organizers
         """
-        # Clean individual organizers
-        cleaned_organizers = [DataCleaner.clean_organizer(org) for org in organizers]
+        # Clean all organizers in bulk
+        cleaned_organizers = DataCleaner.clean_organizers(organizers)
         
         # Remove duplicates
         deduplicated_organizers = DataCleaner.remove_duplicates(cleaned_organizers)
@@ -0,0 +1,214 @@
+import os
+import sys
+import time
+import queue
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, TextIO, Tuple
+from loguru import logger
+from ..config import (
+    LOG_LEVEL, LOG_FILE, LOG_ROTATION, LOG_JSON, LOG_BACKGROUND,
+    LOG_STAGE_LEVELS, LOG_RATE_LIMIT, LOG_RATE_BURST
+)
+
+# Pipeline stages mapped to the module prefix logging for them
+STAGES = {
+    'search': 'src.crawler.google_search',
+    'crawl': 'src.crawler.crawler',
+    'render': 'src.crawler.renderer',
+    'scrape': 'src.scraper',
+    'clean': 'src.utils',
+    'store': 'src.storage',
+    'queue': 'src.distributed',
+    'export': 'src.export',
+    'main': 'src.main'
+}
+
+CONSOLE_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+)
+
+class LogFilter:
+    """
+    Sink filter applying per-stage levels and rate limiting routine messages
+
+    Messages below WARNING are limited per call site with a token bucket, so
+    per-URL lines such as "Found new website" are throttled under high
+    concurrency while run summaries, warnings and errors always pass.
+    """
+
+    def __init__(
+        self,
+        level: str = LOG_LEVEL,
+        stage_levels: Optional[Dict[str, str]] = None,
+        rate: float = LOG_RATE_LIMIT,
+        burst: int = LOG_RATE_BURST
+    ):
+        self.default_level = logger.level(level).no
+        self.warning_level = logger.level('WARNING').no
+        # Longest prefix first so that the most specific stage wins
+        self.prefixes: List[Tuple[str, int]] = sorted(
+            ((STAGES.get(stage, stage), logger.level(stage_level.upper()).no)
+             for stage, stage_level in (stage_levels or {}).items()),
+            key=lambda item: len(item[0]),
+            reverse=True
+        )
+        self.rate = rate
+        self.burst = burst
+        self.suppressed = 0
+
+        self._module_levels: Dict[str, int] = {}
+        self._buckets: Dict[Tuple[str, int], List[float]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def min_level(self) -> int:
+        """Lowest level any stage lets through"""
+        return min([self.default_level] + [level for _, level in self.prefixes])
+
+    def _level_for(self, name: str) -> int:
+        """Resolve and cache the level for a module name"""
+        level = self._module_levels.get(name)
+        if level is None:
+            level = next(
+                (level for prefix, level in self.prefixes
+                 if name == prefix or name.startswith(f"{prefix}.")),
+                self.default_level
+            )
+            self._module_levels[name] = level
+        return level
+
+    def __call__(self, record) -> bool:
+        level = record['level'].no
+        if level < self._level_for(record['name']):
+            return False
+        if level >= self.warning_level or not self.rate:
+            return True
+
+        key = (record['name'], record['line'])
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [self.burst, now]
+
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if tokens >= 1:
+                bucket[0] = tokens - 1
+                return True
+
+            bucket[0] = tokens
+            self.suppressed += 1
+            return False
+
+class BackgroundSink:
+    """
+    Stream-like loguru sink that hands formatted messages to a writer thread
+
+    Logging calls only format the message and put it on an in-process queue;
+    the writer thread batches writes and flushes once the queue is empty.
+    Unlike loguru's enqueue=True, nothing is pickled, which is what matters
+    for thread-based concurrency. Files are rotated by size.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, path: Optional[str] = None, rotation: int = LOG_ROTATION):
+        self.path = path
+        self.rotation = rotation
+        self._owns_stream = stream is None
+        self._stream = stream if stream is not None else open(path, 'a', encoding='utf-8')
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._drain, name='log-writer', daemon=True)
+        self._thread.start()
+
+    def write(self, message: str):
+        self._queue.put(message)
+
+    def _rotate(self):
+        """Move the current log file aside and start a new one"""
+        self._stream.close()
+        os.rename(self.path, f"{self.path}.{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}")
+        self._stream = open(self.path, 'a', encoding='utf-8')
+
+    def _drain(self):
+        while True:
+            message = self._queue.get()
+            while message is not None:
+                self._stream.write(message)
+                try:
+                    message = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            self._stream.flush()
+
+            if self._owns_stream and self.rotation and self._stream.tell() >= self.rotation:
+                self._rotate()
+            if message is None:
+                break
+
+    def stop(self):
+        """Write out queued messages and close the file; called by logger.remove()"""
+        self._queue.put(None)
+        self._thread.join()
+        if self._owns_stream:
+            self._stream.close()
+
+def configure_logging(
+    level: str = LOG_LEVEL,
+    json: bool = LOG_JSON,
+    background: bool = LOG_BACKGROUND,
+    stage_levels: Optional[Dict[str, str]] = None,
+    rate: float = LOG_RATE_LIMIT,
+    burst: int = LOG_RATE_BURST,
+    console: Optional[TextIO] = sys.stdout,
+    log_file: Optional[str] = LOG_FILE
+) -> List[LogFilter]:
+    """
+    Replace all loguru handlers with console and file sinks
+
+    Args:
+        level (str): Default minimum level
+        json (bool): Write structured JSON lines instead of text
+        background (bool): Hand messages to a background thread for writing
+        stage_levels (Dict[str, str], optional): Levels per stage (see STAGES), defaults to LOG_STAGE_LEVELS
+        rate (float): Routine messages per second per call site, 0 disables rate limiting
+        burst (int): Routine messages per call site allowed before rate limiting starts
+        console (TextIO, optional): Console stream, None to disable
+        log_file (str, optional): Log file path, None to disable
+
+    Returns:
+        List[LogFilter]: Filters of the added sinks, exposing suppressed message counts
+    """
+    if stage_levels is None:
+        stage_levels = LOG_STAGE_LEVELS
+
+    logger.remove()
+    filters = []
+
+    sinks = []
+    if console is not None:
+        colorize = not json and callable(getattr(console, 'isatty', None)) and console.isatty()
+        sink = BackgroundSink(stream=console) if background else console
+        sinks.append((sink, {'format': CONSOLE_FORMAT, 'colorize': colorize}))
+    if log_file:
+        if background:
+            sinks.append((BackgroundSink(path=log_file), {}))
+        else:
+            sinks.append((log_file, {'rotation': LOG_ROTATION}))
+
+    for sink, options in sinks:
+        # Each sink gets its own filter so that they do not share rate limit tokens
+        log_filter = LogFilter(level, stage_levels, rate, burst)
+        filters.append(log_filter)
+        if json:
+            options.pop('format', None)
+        logger.add(
+            sink,
+            level=log_filter.min_level,
+            filter=log_filter,
+            serialize=json,
+            **options
+        )
+
+    return filters
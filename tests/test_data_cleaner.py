@@ -0,0 +1,100 @@
+"""
+Bulk cleaning must match per-organizer cleaning exactly
+"""
+import copy
+import random
+import pytest
+from src.models.organizer import Organizer
+from src.utils.data_cleaner import DataCleaner
+from src.utils.validators import PHONE_SEPARATOR, validate_email, validate_email_syntax
+
+EDGE_PHONES = [
+    '0812-3456-7890',
+    '+62 812 3456 7890',
+    '62812345678',
+    '(021) 555-1234',
+    '0215551234',
+    '0812-3456-7890',  # duplicate raw value
+    '081234567890',  # same number once cleaned
+    f'0812{PHONE_SEPARATOR}34567890',  # contains the bulk separator
+    PHONE_SEPARATOR,
+    '',
+    '12345',
+    '0812345678901234',
+    'tel: 0811 222 333',
+]
+
+EDGE_EMAILS = [
+    'info@travel-umroh.co.id',
+    ' INFO@Travel-Umroh.CO.ID ',
+    'info@travel-umroh.co.id',  # duplicate
+    '"john doe"@example.com',
+    '"john\\"doe"@example.com',
+    '"unterminated@example.com',
+    'user@[192.168.0.1]',
+    'user@[IPv6:2001:db8::1]',
+    'first.last+tag@sub.example.org',
+    '.leading@example.com',
+    'double..dot@example.com',
+    'trailing.@example.com',
+    'no-at-sign.example.com',
+    'two@@example.com',
+    'a@b@example.com',
+    'user@localhost',
+    'user@example',
+    'user@-bad-.com',
+    'üser@example.com',
+    'user@exämple.com',
+    f'{"a" * 65}@example.com',
+    f'user@{"a" * 250}.com',
+    '',
+]
+
+def organizer(phones, emails, address=None) -> Organizer:
+    return Organizer(
+        name='Travel Umroh',
+        website_url='https://travel-umroh.co.id',
+        address=address,
+        phone_numbers=list(phones),
+        emails=list(emails)
+    )
+
+def assert_same_as_per_item(organizers, fast_syntax):
+    expected = [DataCleaner.clean_organizer(org) for org in copy.deepcopy(organizers)]
+    actual = DataCleaner.clean_organizers(copy.deepcopy(organizers), fast_syntax=fast_syntax)
+
+    assert [org.phone_numbers for org in actual] == [org.phone_numbers for org in expected]
+    assert [org.emails for org in actual] == [org.emails for org in expected]
+    assert [org.address for org in actual] == [org.address for org in expected]
+
+@pytest.mark.parametrize('email', EDGE_EMAILS)
+def test_email_syntax_matches_validate_email(email):
+    assert validate_email_syntax(email) == validate_email(email)
+
+@pytest.mark.parametrize('fast_syntax', [True, False])
+def test_edge_inputs_match_per_item(fast_syntax):
+    organizers = [
+        organizer(EDGE_PHONES, EDGE_EMAILS, '  Jl.  Sudirman   No. 1 '),
+        organizer(reversed(EDGE_PHONES), reversed(EDGE_EMAILS)),
+        organizer([], []),
+        organizer(EDGE_PHONES[:3], EDGE_EMAILS[:3]),
+    ]
+    assert_same_as_per_item(organizers, fast_syntax)
+
+@pytest.mark.parametrize('fast_syntax', [True, False])
+def test_random_batches_match_per_item(fast_syntax):
+    rng = random.Random(27)
+    phones = EDGE_PHONES + [
+        f"{rng.choice(['0', '+62 ', '62', '(0'])}{rng.randint(10 ** 7, 10 ** 12)}" for _ in range(50)
+    ]
+    emails = EDGE_EMAILS + [
+        rng.choice(['cs', 'info', 'a.b', '"q q"']) + '@' + rng.choice(['umroh.co.id', 'x', '[10.0.0.1]'])
+        for _ in range(50)
+    ]
+
+    for _ in range(50):
+        organizers = [
+            organizer(rng.choices(phones, k=rng.randint(0, 6)), rng.choices(emails, k=rng.randint(0, 6)))
+            for _ in range(rng.randint(1, 20))
+        ]
+        assert_same_as_per_item(organizers, fast_syntax)
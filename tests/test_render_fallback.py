@@ -0,0 +1,75 @@
+"""
+JavaScript rendering fallback against a local fixture page
+
+Run from the repository root with `python -m pytest tests`. The rendering
+test is skipped when playwright or its chromium build is not installed.
+"""
+import os
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from src.crawler.throttle import AdaptiveThrottle
+from src.scraper.scraper import Scraper
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture(scope='module')
+def fixture_server():
+    """Serve the fixtures directory on a free loopback port"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), partial(QuietHandler, directory=FIXTURES_DIR))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://localhost:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture(scope='module')
+def renderer():
+    pytest.importorskip('playwright.async_api')
+    from src.crawler.renderer import Renderer
+
+    try:
+        renderer = Renderer(max_contexts=1, timeout=15)
+    except Exception as e:
+        pytest.skip(f"Headless chromium not available: {e}")
+    yield renderer
+    renderer.close()
+
+def make_scraper(renderer=None) -> Scraper:
+    scraper = Scraper(renderer=renderer, timeout=5, allow_local=True)
+    # No politeness delays against the local fixture server
+    scraper.crawler.throttle = AdaptiveThrottle(initial_delay=0, min_delay=0)
+    return scraper
+
+def test_fixture_has_no_static_contacts(fixture_server):
+    scraper = make_scraper()
+    try:
+        organizer = scraper.scrape(f"{fixture_server}/js_contacts.html")
+    finally:
+        scraper.close()
+
+    assert organizer.name == 'Contoh Travel Umroh'
+    assert organizer.phone_numbers == []
+    assert organizer.emails == []
+
+def test_local_urls_rejected_by_default(fixture_server):
+    scraper = Scraper()
+    try:
+        assert scraper.scrape_page(f"{fixture_server}/js_contacts.html") is None
+    finally:
+        scraper.close()
+
+def test_renderer_recovers_injected_contacts(fixture_server, renderer):
+    scraper = make_scraper(renderer)
+    try:
+        organizer = scraper.scrape(f"{fixture_server}/js_contacts.html")
+    finally:
+        scraper.close()
+
+    assert organizer.phone_numbers == ['081234567890']
+    assert organizer.emails == ['info@contoh-travel.co.id']
@@ -0,0 +1,27 @@
+"""
+Adaptive per-host throttling used by Crawler
+"""
+import pytest
+from src.crawler.crawler import Crawler
+from src.crawler.throttle import AdaptiveThrottle
+
+def make_crawler() -> Crawler:
+    return Crawler(throttle=AdaptiveThrottle(initial_delay=0, min_delay=0, global_max_concurrency=1))
+
+def test_slot_released_when_request_raises(monkeypatch):
+    crawler = make_crawler()
+
+    def fail(*args, **kwargs):
+        raise ValueError("not a requests exception")
+
+    monkeypatch.setattr(crawler.session, 'get', fail)
+    with pytest.raises(ValueError):
+        crawler._request('http://example.co.id/')
+
+    # A leaked slot would make the next acquire() block forever
+    state = crawler.throttle_state()['example.co.id']
+    assert state['active'] == 0
+    assert crawler.throttle._active == 0
+    assert state['requests'] == 1
+    assert state['last_status'] is None
+    crawler.close()
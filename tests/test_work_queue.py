@@ -0,0 +1,62 @@
+"""
+Lease expiry and retries of the shared work queue
+"""
+import time
+import pytest
+from src.distributed.work_queue import WorkQueue
+
+LEASE_SECONDS = 0.05
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = WorkQueue(str(tmp_path / 'queue.db'), lease_seconds=LEASE_SECONDS, max_attempts=2, host_delay=0)
+    yield queue
+    queue.close()
+
+def last_error(queue: WorkQueue, url: str) -> str:
+    return queue.conn.execute('SELECT last_error FROM tasks WHERE url = ?', (url,)).fetchone()[0]
+
+def test_expired_lease_is_retried_then_failed(queue):
+    url = 'http://agen-umroh.example/'
+    queue.enqueue([url])
+
+    # Worker crashes or hangs without calling ack() or fail()
+    first = queue.lease('crashed-worker')
+    assert first.attempts == 1
+    assert queue.lease('other-worker') is None
+    time.sleep(LEASE_SECONDS * 2)
+
+    second = queue.lease('hung-worker')
+    assert second.id == first.id
+    assert second.attempts == 2
+    assert not queue.is_drained()
+    time.sleep(LEASE_SECONDS * 2)
+
+    # Last attempt expired, so the task fails instead of being leased again
+    assert queue.lease('other-worker') is None
+    assert queue.stats() == {'pending': 0, 'leased': 0, 'done': 0, 'failed': 1}
+    assert last_error(queue, url) == 'lease expired'
+    assert queue.is_drained()
+
+def test_expire_leases_without_workers(queue):
+    url = 'http://agen-umroh.example/'
+    queue.enqueue([url])
+
+    queue.lease('worker')
+    time.sleep(LEASE_SECONDS * 2)
+    assert queue.expire_leases() == 0  # first attempt expired, still retryable
+
+    queue.lease('worker')
+    time.sleep(LEASE_SECONDS * 2)
+    assert queue.expire_leases() == 1
+    assert last_error(queue, url) == 'lease expired'
+    assert queue.is_drained()
+
+def test_late_ack_after_expiry_is_rejected(queue):
+    queue.enqueue(['http://agen-umroh.example/'])
+
+    task = queue.lease('slow-worker')
+    time.sleep(LEASE_SECONDS * 2)
+    queue.lease('fast-worker')
+
+    assert not queue.ack(task, 'slow-worker', None)